@@ -110,7 +110,7 @@ class SimklAuth:
             
             return True
         except Exception as e:
-            log(f"[auth v{__version__}] SimklAuth.clear_authentication() EXCEPTION in clear_authentication: {e}", xbmc.LOGERROR)
+            log(f"[auth v{__version__}] SimklAuth.clear_authentication() EXCEPTION in clear_authentication: {e}", level=xbmc.LOGERROR)
             log(f"[auth v{__version__}] SimklAuth.clear_authentication() ========== clear_authentication() FAILED ==========")
             
             return False
@@ -30,11 +30,13 @@ Professional code - Project 4 standards
 import xbmc
 import xbmcgui
 import xbmcaddon
+import threading
 
 from resources.lib import utils
 from resources.lib.strings import (
     get_rating_description,
     getString,
+    getStrings,
     SIMKL,
     RATE_TITLE,
     CURRENT_RATING,
@@ -51,6 +53,50 @@ __version__ = '7.5.6'
 # Log module initialization
 xbmc.log(f'[SIMKL Scrobbler] rating.py v{__version__} - Rating service module loading', level=xbmc.LOGINFO)
 
+# Action codes
+ACTION_PREVIOUS_MENU = 10
+ACTION_NAV_BACK = 92
+
+# Shared xbmcgui.Dialog for notifications - lazy loaded by _dlg()
+_DIALOG = None
+
+# Maps rating media_info keys to SIMKL API id keys
+_ID_KEYS = (
+    ('simkl_id', 'simkl'),
+    ('imdb_id', 'imdb'),
+    ('tmdb_id', 'tmdb'),
+    ('tvdb_id', 'tvdb')
+)
+
+
+def _dlg():
+    """
+    Get the shared xbmcgui.Dialog instance (lazy loaded).
+    
+    Returns:
+        xbmcgui.Dialog instance
+    """
+    global _DIALOG
+    if _DIALOG is None:
+        _DIALOG = xbmcgui.Dialog()
+    return _DIALOG
+
+
+def _build_api_media_info(media_info):
+    """
+    Build the media dict expected by api.add_rating() / api.remove_rating().
+    
+    Args:
+        media_info (dict): Rating media info with *_id keys
+        
+    Returns:
+        dict: {'title': ..., 'ids': {...}} containing only the IDs that are set
+    """
+    return {
+        'title': media_info.get('title', 'Unknown'),
+        'ids': {dst: media_info[src] for src, dst in _ID_KEYS if media_info.get(src)}
+    }
+
 
 def rating_check(media_type, media_info, watched_time, total_time, api):
     """
@@ -66,24 +112,30 @@ def rating_check(media_type, media_info, watched_time, total_time, api):
         api: SIMKL API client instance
     """
     try:
-        # Create rating service
-        rating_service = RatingService(api)
-        
-        # Check if prompts are enabled for this media type
-        if not rating_service.should_prompt_for_rating(media_type):
-            utils.log(f"[rating v{__version__}] rating_check() Rating prompts disabled for {media_type}", xbmc.LOGDEBUG)
+        # Check if prompts are enabled for this media type - cheapest gate,
+        # so users with prompts disabled never pay for RatingService/Addon()
+        if not RatingService.should_prompt_for_rating(media_type):
+            utils.log("[rating v%s] rating_check() Rating prompts disabled for %s", __version__, media_type, level=xbmc.LOGDEBUG)
             return
         
         # Check minimum view time threshold
+        # Unknown duration (e.g. some streams) can't prove the threshold was met
+        if total_time <= 0:
+            utils.log("[rating v%s] rating_check() No duration available - skipping rating prompt", __version__)
+            return
         min_view_pct = utils.get_setting_int("rating_min_view", 75)
-        if total_time > 0:
-            viewed_pct = (watched_time / total_time) * 100
-            if viewed_pct < min_view_pct:
-                utils.log(f"[rating v{__version__}] rating_check() Viewed {viewed_pct:.1f}% < minimum {min_view_pct}% for rating prompt")
-                return
+        if watched_time * 100 < total_time * min_view_pct:
+            utils.log("[rating v%s] rating_check() Viewed %.1f%% < minimum %d%% for rating prompt",
+                      __version__, watched_time * 100 / total_time, min_view_pct)
+            return
         
+        # We need at least ONE ID to submit a rating to SIMKL
+        ids = media_info.get('ids') or {}
+        if not any(ids.get(k) for k in ('simkl', 'imdb', 'tmdb', 'tvdb')):
+            utils.log("[rating v%s] rating_check() No IDs available for rating - cannot rate", __version__, level=xbmc.LOGWARNING)
+            return
+
         # Build media info dict for rating dialog
-        ids = media_info.get('ids', {})
         rating_media_info = {
             'media_type': media_type,
             'title': media_info.get('title', 'Unknown'),
@@ -92,23 +144,15 @@ def rating_check(media_type, media_info, watched_time, total_time, api):
             'tmdb_id': ids.get('tmdb'),
             'tvdb_id': ids.get('tvdb')
         }
-        
-        # We need at least ONE ID to submit a rating to SIMKL
-        has_any_id = any([rating_media_info.get('simkl_id'),
-                         rating_media_info.get('imdb_id'),
-                         rating_media_info.get('tmdb_id'),
-                         rating_media_info.get('tvdb_id')])
-        if not has_any_id:
-            utils.log(f"[rating v{__version__}] rating_check() No IDs available for rating - cannot rate", xbmc.LOGWARNING)
-            return
-        
-        utils.log(f"[rating v{__version__}] rating_check() Rating check passed for '{rating_media_info['title']}' - showing dialog")
+
+        utils.log("[rating v%s] rating_check() Rating check passed for '%s' - showing dialog", __version__, rating_media_info['title'])
         
         # Show rating dialog
+        rating_service = RatingService(api)
         rating_service.prompt_for_rating(rating_media_info)
         
     except Exception as e:
-        utils.log(f"[rating v{__version__}] rating_check() Error in rating_check: {e}", xbmc.LOGERROR)
+        utils.log("[rating v%s] rating_check() Error in rating_check: %s", __version__, e, level=xbmc.LOGERROR)
 
 
 class RatingDialog(xbmcgui.WindowXMLDialog):
@@ -130,63 +174,125 @@ class RatingDialog(xbmcgui.WindowXMLDialog):
         self.current_rating = kwargs.get('current_rating', None)
         self.selected_rating = None
         self.submitted = False
+        # Guards current_rating / UI state against the background lookup
+        # in RatingService.prompt_for_rating() landing mid-onInit
+        self._state_lock = threading.Lock()
+        self._initialized = False
+        self._closed = False
+        # Set once the user clicks a star - from then on a late current
+        # rating must not touch the selection or the stars. Focus doesn't
+        # count: the skin's defaultcontrol focuses star 1 on open.
+        self._user_interacted = False
+        # Dialog labels in one batch - a repeat open gets the cached tuple
+        (self._title_fmt, self._current_fmt,
+         self._click_star, self._select_first) = getStrings(
+            (RATE_TITLE, CURRENT_RATING, CLICK_STAR, SELECT_RATING_FIRST))
         
     def onInit(self):
         """Called when dialog is initialized - set up UI"""
         try:
-            # Hide all gold stars first - XML has no <visible> tags so they
-            # start visible. Python controls ALL star visibility.
-            for i in range(1, 11):
-                self.getControl(300 + i).setVisible(False)
-            
             # Set title label
             title_label = self.getControl(100)
-            title_label.setLabel(getString(RATE_TITLE).format(self.media_title))
+            title_label.setLabel(self._title_fmt.format(self.media_title))
             
-            # Set initial description and star state
-            if self.current_rating:
-                self.selected_rating = self.current_rating
-                desc_label = self.getControl(101)
-                rating_desc = get_rating_description(self.current_rating)
-                desc_label.setLabel(getString(CURRENT_RATING).format(
-                    self.current_rating,
-                    rating_desc
-                ))
-                
-                # Highlight current rating stars
-                self._highlight_stars(self.current_rating)
-            else:
-                desc_label = self.getControl(101)
-                desc_label.setLabel(getString(CLICK_STAR))
-                
+            # Set initial description and star state. XML has no <visible>
+            # tags on the gold stars (they would override setVisible()), so
+            # they start visible - _highlight_stars() sets every gold star
+            # in a single pass, hiding those above the current rating.
+            with self._state_lock:
+                if self._user_interacted:
+                    # A star was already clicked - leave it alone
+                    pass
+                elif self.current_rating:
+                    self._show_current_rating(self.current_rating)
+                else:
+                    desc_label = self.getControl(101)
+                    desc_label.setLabel(self._click_star)
+
+                    # No rating yet - hide all gold stars
+                    self._highlight_stars(0)
+                self._initialized = True
+
+        except Exception as e:
+            utils.log("[rating v%s] RatingDialog.onInit() Error initializing rating dialog: %s", __version__, e, level=xbmc.LOGERROR)
+    
+    def set_current_rating(self, rating):
+        """
+        Apply a current rating that arrived after the dialog was opened.
+        
+        Called from the background lookup thread. If the dialog has not
+        initialized yet, onInit() picks the value up. Once the user has
+        clicked a star, their choice wins: only current_rating
+        is stored, and neither selected_rating nor the stars change.
+        
+        Args:
+            rating (int or None): Current SIMKL rating (1-10) or None
+        """
+        if not rating:
+            return
+        with self._state_lock:
+            self.current_rating = rating
+            if self._initialized and not self._closed and not self._user_interacted:
+                self._show_current_rating(rating)
+    
+    def _show_current_rating(self, rating):
+        """Select the current rating and show it in the description and stars"""
+        try:
+            self.selected_rating = rating
+            desc_label = self.getControl(101)
+            rating_desc = get_rating_description(rating)
+            desc_label.setLabel(self._current_fmt.format(
+                rating,
+                rating_desc
+            ))
+            
+            # Highlight current rating stars
+            self._highlight_stars(rating)
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingDialog.onInit() Error initializing rating dialog: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingDialog._show_current_rating() Error: %s", __version__, e, level=xbmc.LOGERROR)
+    
+    def close(self):
+        """Close the dialog and ignore any late current-rating updates"""
+        with self._state_lock:
+            self._closed = True
+        super(RatingDialog, self).close()
+    
+    def onAction(self, action):
+        """Mark the dialog closed on Back/Escape"""
+        # Kodi closes the dialog natively on these without calling close()
+        if action.getId() in (ACTION_PREVIOUS_MENU, ACTION_NAV_BACK):
+            self.submitted = False
+            self.close()
     
     def onClick(self, controlId):
         """Handle button clicks"""
         # Star buttons are IDs 1-10
         if 1 <= controlId <= 10:
-            if self.selected_rating == controlId:
-                # Clicking the same star again deselects (unrate)
-                self.selected_rating = 0
-                self._highlight_stars(0)
-                desc_label = self.getControl(101)
-                desc_label.setLabel(getString(CLICK_STAR))
-            else:
-                self.selected_rating = controlId
-                self._update_description(controlId)
-                self._highlight_stars(controlId)
+            with self._state_lock:
+                self._user_interacted = True
+                if self.selected_rating == controlId:
+                    # Clicking the same star again deselects (unrate)
+                    self.selected_rating = 0
+                    self._highlight_stars(0)
+                    desc_label = self.getControl(101)
+                    desc_label.setLabel(self._click_star)
+                else:
+                    self.selected_rating = controlId
+                    self._update_description(controlId)
+                    self._highlight_stars(controlId)
             
         # Submit button
         elif controlId == 9010:
-            if self.selected_rating is not None:
+            with self._state_lock:
+                has_selection = self.selected_rating is not None
+            if has_selection:
                 self.submitted = True
                 self.close()
             else:
                 # No rating selected yet (first open, never clicked anything)
-                xbmcgui.Dialog().notification(
+                _dlg().notification(
                     getString(SIMKL),
-                    getString(SELECT_RATING_FIRST),
+                    self._select_first,
                     xbmcgui.NOTIFICATION_WARNING,
                     3000
                 )
@@ -203,8 +309,9 @@ class RatingDialog(xbmcgui.WindowXMLDialog):
         Does NOT change selected_rating - that only happens on click.
         """
         if 1 <= controlId <= 10:
-            self._update_description(controlId)
-            self._highlight_stars(controlId)
+            with self._state_lock:
+                self._update_description(controlId)
+                self._highlight_stars(controlId)
     
     def _update_description(self, rating):
         """Update rating description label with full description and meaning"""
@@ -213,7 +320,7 @@ class RatingDialog(xbmcgui.WindowXMLDialog):
             description = get_rating_description(rating)
             desc_label.setLabel(getString(RATING_DESC_FORMAT).format(rating, description))
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingDialog._update_description() Error: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingDialog._update_description() Error: %s", __version__, e, level=xbmc.LOGERROR)
     
     def _highlight_stars(self, rating):
         """Set star visuals - gold for 1..rating, grey for (rating+1)..10.
@@ -228,7 +335,7 @@ class RatingDialog(xbmcgui.WindowXMLDialog):
                 gold_star = self.getControl(300 + i)
                 gold_star.setVisible(i <= rating)
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingDialog._highlight_stars() Error: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingDialog._highlight_stars() Error: %s", __version__, e, level=xbmc.LOGERROR)
 
 
 class RatingService:
@@ -252,7 +359,8 @@ class RatingService:
         self.api = api_client
         self.addon = xbmcaddon.Addon()
         
-    def should_prompt_for_rating(self, media_type):
+    @staticmethod
+    def should_prompt_for_rating(media_type):
         """
         Check if we should prompt for rating based on settings
         
@@ -268,14 +376,11 @@ class RatingService:
             watching an episode.
         """
         if media_type == 'movie':
-            return self.addon.getSettingBool('rating_prompt_movies')
+            return utils.get_setting_bool('rating_prompt_movies')
         elif media_type == 'episode':
             # SIMKL rates shows, not individual episodes
             # This prompts to rate the show after watching an episode
-            try:
-                return self.addon.getSettingBool('rating_prompt_shows')
-            except Exception:
-                return False
+            return utils.get_setting_bool('rating_prompt_shows')
         return False
     
     def get_current_rating(self, media_type, simkl_id=None, imdb_id=None, tmdb_id=None):
@@ -302,32 +407,36 @@ class RatingService:
             
             if not ratings_list:
                 return None
-            
+
+            # Build the (id_type, value) lookup once - TMDb IDs are compared
+            # as strings because SIMKL returns them as either int or str
+            query = {}
+            if simkl_id:
+                query[('simkl', simkl_id)] = True
+            if imdb_id:
+                query[('imdb', imdb_id)] = True
+            if tmdb_id:
+                query[('tmdb', str(tmdb_id))] = True
+
+            item_key = 'movie' if media_type == 'movie' else 'show'
+
             for item in ratings_list:
-                if media_type == 'movie':
-                    item_data = item.get('movie', {})
-                else:
-                    item_data = item.get('show', {})
-                
-                item_ids = item_data.get('ids', {})
-                
+                item_ids = item.get(item_key, {}).get('ids', {})
+
                 # Also check top-level ids (SIMKL API format varies)
                 if not item_ids:
                     item_ids = item.get('ids', {})
-                
+
                 # Match on any available ID
-                if simkl_id and item_ids.get('simkl') == simkl_id:
-                    return item.get('user_rating', item.get('rating'))
-                if imdb_id and item_ids.get('imdb') == imdb_id:
-                    return item.get('user_rating', item.get('rating'))
-                if tmdb_id and str(item_ids.get('tmdb', '')) == str(tmdb_id):
-                    return item.get('user_rating', item.get('rating'))
+                for k, v in item_ids.items():
+                    if (k, v if k != 'tmdb' else str(v)) in query:
+                        return item.get('user_rating', item.get('rating'))
             
-            utils.log(f"[rating v{__version__}] RatingService.get_current_rating() No matching rating found in {len(ratings_list)} entries")
+            utils.log("[rating v%s] RatingService.get_current_rating() No matching rating found in %s entries", __version__, len(ratings_list))
             return None
             
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingService.get_current_rating() Error retrieving current rating: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingService.get_current_rating() Error retrieving current rating: %s", __version__, e, level=xbmc.LOGERROR)
             return None
     
     def prompt_for_rating(self, media_info):
@@ -353,23 +462,31 @@ class RatingService:
             media_type = media_info.get('media_type')
             title = media_info.get('title', 'Unknown')
             
-            # Look up existing rating using any available ID
-            current_rating = self.get_current_rating(
-                media_type,
-                simkl_id=media_info.get('simkl_id'),
-                imdb_id=media_info.get('imdb_id'),
-                tmdb_id=media_info.get('tmdb_id')
-            )
-            utils.log(f"[rating v{__version__}] RatingService.prompt_for_rating() Current rating lookup: {current_rating}")
-            
             # Check rerating setting - fresh Addon() read to pick up recent changes
             try:
                 allow_rerating = xbmcaddon.Addon().getSettingBool("rating_allow_rerating")
             except Exception:
                 allow_rerating = False
-            if current_rating and not allow_rerating:
-                utils.log(f"[rating v{__version__}] RatingService.prompt_for_rating() Already rated ({current_rating}/10) and rerating disabled - skipping")
-                return False
+            
+            lookup_ids = {
+                'simkl_id': media_info.get('simkl_id'),
+                'imdb_id': media_info.get('imdb_id'),
+                'tmdb_id': media_info.get('tmdb_id')
+            }
+            
+            if allow_rerating:
+                # The current rating only pre-selects stars, so open the
+                # dialog straight away and fill it in when the (possibly
+                # large) ratings list arrives
+                current_rating = None
+            else:
+                # Rerating disabled - must know the current rating before
+                # deciding whether to show the dialog at all
+                current_rating = self.get_current_rating(media_type, **lookup_ids)
+                utils.log("[rating v%s] RatingService.prompt_for_rating() Current rating lookup: %s", __version__, current_rating)
+                if current_rating:
+                    utils.log("[rating v%s] RatingService.prompt_for_rating() Already rated (%s/10) and rerating disabled - skipping", __version__, current_rating)
+                    return False
             
             # Show rating dialog
             dialog = RatingDialog(
@@ -381,6 +498,15 @@ class RatingService:
                 media_type=media_type,
                 current_rating=current_rating
             )
+            
+            if allow_rerating:
+                lookup = threading.Thread(
+                    target=self._lookup_current_rating,
+                    args=(dialog, media_type, lookup_ids),
+                    daemon=True
+                )
+                lookup.start()
+            
             dialog.doModal()
             
             # Check if user submitted a rating
@@ -390,7 +516,7 @@ class RatingService:
                     success = self.remove_rating_from_simkl(media_info)
                     
                     if success:
-                        xbmcgui.Dialog().notification(
+                        _dlg().notification(
                             getString(SIMKL),
                             f"Rating removed: {title}",
                             xbmcgui.NOTIFICATION_INFO,
@@ -398,7 +524,7 @@ class RatingService:
                         )
                         return True
                     else:
-                        xbmcgui.Dialog().notification(
+                        _dlg().notification(
                             getString(SIMKL),
                             getString(SUBMIT_RATING_FAILED),
                             xbmcgui.NOTIFICATION_ERROR,
@@ -413,7 +539,7 @@ class RatingService:
                         # Get the localized rating description
                         desc = get_rating_description(dialog.selected_rating)
                         
-                        xbmcgui.Dialog().notification(
+                        _dlg().notification(
                             getString(SIMKL),
                             getString(RATED_AS).format(
                                 title,
@@ -425,7 +551,7 @@ class RatingService:
                         )
                         return True
                     else:
-                        xbmcgui.Dialog().notification(
+                        _dlg().notification(
                             getString(SIMKL),
                             getString(SUBMIT_RATING_FAILED),
                             xbmcgui.NOTIFICATION_ERROR,
@@ -437,9 +563,22 @@ class RatingService:
             return False
             
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingService.prompt_for_rating() Error prompting for rating: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingService.prompt_for_rating() Error prompting for rating: %s", __version__, e, level=xbmc.LOGERROR)
             return False
     
+    def _lookup_current_rating(self, dialog, media_type, lookup_ids):
+        """
+        Background thread: fetch the current rating and push it into the dialog.
+        
+        Args:
+            dialog (RatingDialog): Open rating dialog to update
+            media_type (str): 'movie' or 'episode'
+            lookup_ids (dict): simkl_id / imdb_id / tmdb_id keyword arguments
+        """
+        current_rating = self.get_current_rating(media_type, **lookup_ids)
+        utils.log("[rating v%s] RatingService._lookup_current_rating() Current rating lookup: %s", __version__, current_rating)
+        dialog.set_current_rating(current_rating)
+    
     def remove_rating_from_simkl(self, media_info):
         """
         Remove rating from SIMKL API
@@ -453,34 +592,22 @@ class RatingService:
         try:
             media_type = media_info.get('media_type')
             
-            api_media_info = {
-                'ids': {},
-                'title': media_info.get('title', 'Unknown')
-            }
-            
-            if media_info.get('simkl_id'):
-                api_media_info['ids']['simkl'] = media_info['simkl_id']
-            if media_info.get('imdb_id'):
-                api_media_info['ids']['imdb'] = media_info['imdb_id']
-            if media_info.get('tmdb_id'):
-                api_media_info['ids']['tmdb'] = media_info['tmdb_id']
-            if media_info.get('tvdb_id'):
-                api_media_info['ids']['tvdb'] = media_info['tvdb_id']
+            api_media_info = _build_api_media_info(media_info)
             
             _title = media_info.get('title', 'Unknown')
-            utils.log(f"[rating v{__version__}] RatingService.remove_rating_from_simkl() Removing rating for '{_title}'")
+            utils.log("[rating v%s] RatingService.remove_rating_from_simkl() Removing rating for '%s'", __version__, _title)
             
             response = self.api.remove_rating(media_type, api_media_info)
             
             if response:
-                utils.log(f"[rating v{__version__}] RatingService.remove_rating_from_simkl() Rating removed successfully")
+                utils.log("[rating v%s] RatingService.remove_rating_from_simkl() Rating removed successfully", __version__)
                 return True
             else:
-                utils.log(f"[rating v{__version__}] RatingService.remove_rating_from_simkl() Failed to remove rating", xbmc.LOGWARNING)
+                utils.log("[rating v%s] RatingService.remove_rating_from_simkl() Failed to remove rating", __version__, level=xbmc.LOGWARNING)
                 return False
                 
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingService.remove_rating_from_simkl() Error: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingService.remove_rating_from_simkl() Error: %s", __version__, e, level=xbmc.LOGERROR)
             return False
 
     def submit_rating(self, media_info, rating):
@@ -497,36 +624,23 @@ class RatingService:
         try:
             media_type = media_info.get('media_type')
             
-            # Build api_media_info dict for api.add_rating()
-            api_media_info = {
-                'ids': {},
-                'title': media_info.get('title', 'Unknown')
-            }
-            
-            # Add all available IDs
-            if media_info.get('simkl_id'):
-                api_media_info['ids']['simkl'] = media_info['simkl_id']
-            if media_info.get('imdb_id'):
-                api_media_info['ids']['imdb'] = media_info['imdb_id']
-            if media_info.get('tmdb_id'):
-                api_media_info['ids']['tmdb'] = media_info['tmdb_id']
-            if media_info.get('tvdb_id'):
-                api_media_info['ids']['tvdb'] = media_info['tvdb_id']
+            # Build api_media_info dict for api.add_rating() with all available IDs
+            api_media_info = _build_api_media_info(media_info)
             
             # Submit to SIMKL using correct api.add_rating signature:
             # add_rating(media_type, media_info, rating)
             _title = media_info.get('title', 'Unknown')
-            utils.log(f"[rating v{__version__}] RatingService.submit_rating() Submitting rating {rating} for '{_title}' to SIMKL")
+            utils.log("[rating v%s] RatingService.submit_rating() Submitting rating %s for '%s' to SIMKL", __version__, rating, _title)
             
             response = self.api.add_rating(media_type, api_media_info, rating)
             
             if response:
-                utils.log(f"[rating v{__version__}] RatingService.submit_rating() Rating submitted successfully")
+                utils.log("[rating v%s] RatingService.submit_rating() Rating submitted successfully", __version__)
                 return True
             else:
-                utils.log(f"[rating v{__version__}] RatingService.submit_rating() Failed to submit rating", xbmc.LOGERROR)
+                utils.log("[rating v%s] RatingService.submit_rating() Failed to submit rating", __version__, level=xbmc.LOGERROR)
                 return False
                 
         except Exception as e:
-            utils.log(f"[rating v{__version__}] RatingService.submit_rating() Error submitting rating: {e}", xbmc.LOGERROR)
+            utils.log("[rating v%s] RatingService.submit_rating() Error submitting rating: %s", __version__, e, level=xbmc.LOGERROR)
             return False
@@ -20,8 +20,10 @@ Professional code - Project 4 standards
 """
 
 import xbmc
+import os
 import time
-import math
+import queue
+import threading
 from resources.lib.utils import (
     log, log_error, log_debug, log_warning,
     get_setting, get_setting_bool, get_setting_int, get_setting_float, notify
@@ -35,6 +37,22 @@ __version__ = '7.5.8'
 # Log module initialization
 xbmc.log(f'[SIMKL Scrobbler] scrobbler.py v{__version__} - Core scrobbler engine loading', level=xbmc.LOGINFO)
 
+# Minimum seconds between two consecutive scrobble/start calls. Seek, resume
+# and the periodic keepalive can all request a "start" close together; within
+# this window the previous response is reused instead of another round trip.
+MIN_SCROBBLE_INTERVAL = 60
+
+# Seconds a pause must last before scrobble/pause is sent. A quick
+# pause/unpause flicker (remote control taps) then sends nothing at all.
+PAUSE_SCROBBLE_DELAY = 0.5
+
+# SIMKL marks content watched via /scrobble/stop at this progress or higher
+SIMKL_WATCHED_THRESHOLD = 80
+
+# Longest _scrobble_stop() waits for the worker (seconds): the API's 30s
+# request timeout plus a margin. Bounds the stall on the service main thread.
+STOP_WAIT_TIMEOUT = 35
+
 
 class SimklScrobbler:
     """
@@ -53,19 +71,50 @@ class SimklScrobbler:
         """
         self.api = api
         
+        # Shared player handle - reused by playback_started/transition_check
+        # instead of building a new xbmc.Player() wrapper on every call
+        self._player = xbmc.Player()
+        
         # Current playback state
         self.is_playing = False
         self.is_paused = False
+        self._active = False  # is_playing and not is_paused - transition_check fast path
         self.current_video = None
         self.current_video_info = None  # SIMKL-formatted info
+        self._media_type = None  # "movie"/"episode", cached from current_video
+        self._is_episode = False
+        self._display_title = None  # "Title" or "Show SxxEyy", set in playback_started
+        self._scrobble_payload = None  # api.scrobble() content kwargs, set in _identify_content
         
         # Progress tracking
         self.watched_time = 0  # seconds
         self.video_duration = 1  # seconds (avoid div by zero)
         self.last_transition_check = 0
-        self.last_progress_update = 0  # timestamp of last SIMKL progress update
+        self.last_progress_update = 0  # monotonic timestamp of last SIMKL progress update
         self.paused_at = 0
         
+        # rating.rating_check, imported lazily by _check_rating
+        self._rating_check = None
+        
+        # Settings snapshot for the current playback session (see _load_settings)
+        self._settings = {}
+        
+        # Scrobble debounce state (see _scrobble)
+        self._last_scrobble_action = None
+        
+        # Delayed pause scrobble (see playback_paused). The lock makes
+        # "cancel the timer" vs "timer fires" a clean either/or.
+        self._pause_timer = None
+        self._pause_lock = threading.Lock()
+        
+        # Scrobble requests are sent by a background worker so pause/resume
+        # never block on HTTP. Items: (action, media_type, video_info, progress, on_done)
+        self._scrobble_queue = queue.Queue()
+        self._closing = False  # Set by close(); nothing queued after it is sent
+        self._scrobble_thread = threading.Thread(target=self._scrobble_worker, name="SIMKL-Scrobble")
+        self._scrobble_thread.daemon = True
+        self._scrobble_thread.start()
+        
         log(f"[scrobbler v{__version__}] SimklScrobbler.__init__() SimklScrobbler initialized")
     
     def playback_started(self, data):
@@ -88,6 +137,11 @@ class SimklScrobbler:
         self.current_video_info = None
         self.watched_time = 0
         self.paused_at = 0
+        self.last_progress_update = 0
+        self._last_scrobble_action = None
+        
+        # Read every setting this session needs in one go
+        self._load_settings()
         
         # Check exclusions BEFORE wasting time on API calls
         # This is where we filter out Live TV, HTTP, plugins, and custom paths
@@ -99,26 +153,35 @@ class SimklScrobbler:
         
         # Check type-specific settings
         media_type = data.get("type", "movie")
-        if media_type == "movie" and not get_setting_bool("scrobble_movie"):
+        self._media_type = media_type
+        self._is_episode = (media_type == "episode")
+        if media_type == "movie" and not self._settings["scrobble_movie"]:
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() Movie scrobbling is disabled")
             return
-        elif media_type == "episode" and not get_setting_bool("scrobble_episode"):
+        elif media_type == "episode" and not self._settings["scrobble_episode"]:
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() TV show scrobbling is disabled")
             return
         
         # Verify we're still playing (user might have stopped)
-        if not xbmc.Player().isPlayingVideo():
+        player = self._player
+        if not player.isPlayingVideo():
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() Player stopped before we could start scrobbling")
             return
         
-        # Wait for possible silent seek (resume from position)
-        xbmc.sleep(1000)
-        
         try:
+            # Wait for possible silent seek (resume from position): sample the
+            # position every 100ms (1s at most) and go on as soon as it stops
+            # jumping - without a resume that's after the first sample
+            for _ in range(10):
+                position = player.getTime()
+                xbmc.sleep(100)
+                if abs(player.getTime() - position) < 0.5:
+                    break
+            
             # Get current playback position and duration
-            player = xbmc.Player()
             self.watched_time = player.getTime()
-            self.video_duration = player.getTotalTime()
+            # Stored as whole seconds so progress math needs no flooring
+            self.video_duration = int(player.getTotalTime())
             
             if self.video_duration == 0:
                 # Fallback durations if not available
@@ -142,28 +205,61 @@ class SimklScrobbler:
         # We're officially scrobbling!
         self.is_playing = True
         self.is_paused = False
-        self.last_transition_check = time.time()
-        self.last_progress_update = time.time()
-        
-        # Send scrobble start to SIMKL
-        response = self._scrobble("start")
+        self._active = True
+        self.last_transition_check = time.monotonic()
+        
+        title = data.get("title", "Unknown")
+        if self._is_episode:
+            show = data.get("show_title", title)
+            season = data.get("season", 0)
+            episode = data.get("episode", 0)
+            title = f"{show} S{season:02d}E{episode:02d}"
+        self._display_title = title
+        
+        # Send scrobble start to SIMKL - the notification is shown by the
+        # scrobble worker once the response arrives
+        self._scrobble("start", on_done=lambda response: self._on_scrobble_started(title, response))
+    
+    def _on_scrobble_started(self, title, response):
+        """
+        Report the result of the initial scrobble/start (runs on the scrobble worker).
         
+        Args:
+            title: Display title of the content being scrobbled
+            response: API response or None
+        """
         if response:
-            title = data.get("title", "Unknown")
-            if media_type == "episode":
-                show = data.get("show_title", title)
-                season = data.get("season", 0)
-                episode = data.get("episode", 0)
-                title = f"{show} S{season:02d}E{episode:02d}"
-            
-            show_notif = get_setting_bool("show_notifications")
-            log(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() Scrobble start SUCCESS | title={title} | show_notifications={show_notif}")
+            show_notif = self._settings.get("show_notifications", False)
+            log(f"[scrobbler v{__version__}] SimklScrobbler._on_scrobble_started() Scrobble start SUCCESS | title={title} | show_notifications={show_notif}")
             if show_notif:
                 notify(getString(NOW_SCROBBLING), title)
             
-            log(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() Started scrobbling: {title}")
+            log(f"[scrobbler v{__version__}] SimklScrobbler._on_scrobble_started() Started scrobbling: {title}")
         else:
-            log_warning(f"[scrobbler v{__version__}] SimklScrobbler.playback_started() Failed to start scrobble - response was None - continuing without")
+            log_warning(f"[scrobbler v{__version__}] SimklScrobbler._on_scrobble_started() Failed to start scrobble - response was None - continuing without")
+    
+    def _load_settings(self):
+        """
+        Snapshot the settings used during a playback session.
+        
+        Read once per playback_started (and again via reload_settings() when
+        the user changes settings) instead of querying Kodi at every
+        decision point - transition_check alone runs every second.
+        """
+        self._settings = {
+            "scrobble_movie": get_setting_bool("scrobble_movie"),
+            "scrobble_episode": get_setting_bool("scrobble_episode"),
+            "show_notifications": get_setting_bool("show_notifications"),
+            "periodic_progress_update": get_setting_bool("periodic_progress_update"),
+            "threshold": get_setting_int("scrobble_threshold", 70),
+            "rating_prompt_movies": get_setting_bool("rating_prompt_movies"),
+            "rating_prompt_shows": get_setting_bool("rating_prompt_shows"),
+        }
+    
+    def reload_settings(self):
+        """Refresh the settings snapshot after the user changed settings."""
+        self._load_settings()
+        log_debug(f"[scrobbler v{__version__}] SimklScrobbler.reload_settings() Settings snapshot refreshed: {self._settings}")
     
     def playback_paused(self):
         """Handle playback paused event."""
@@ -172,10 +268,41 @@ class SimklScrobbler:
         
         log(f"[scrobbler v{__version__}] SimklScrobbler.playback_paused() Scrobble paused")
         self.is_paused = True
-        self.paused_at = time.time()
+        self._active = False
+        self.paused_at = time.monotonic()
+        
+        # Tell SIMKL we're paused - but only once the pause has lasted
+        # PAUSE_SCROBBLE_DELAY, so a flicker doesn't cost two round trips
+        with self._pause_lock:
+            if self._pause_timer:
+                self._pause_timer.cancel()
+            self._pause_timer = threading.Timer(PAUSE_SCROBBLE_DELAY, self._emit_pause)
+            self._pause_timer.daemon = True
+            self._pause_timer.start()
+    
+    def _emit_pause(self):
+        """Timer callback: send the delayed scrobble/pause if still paused."""
+        with self._pause_lock:
+            if self._pause_timer is None:
+                return  # Cancelled by resume/stop while we were waiting on the lock
+            self._pause_timer = None
+            if self.is_playing and self.is_paused:
+                self._scrobble("pause")
+    
+    def _cancel_pending_pause(self):
+        """
+        Cancel a delayed scrobble/pause that has not been sent yet.
         
-        # Tell SIMKL we're paused
-        self._scrobble("pause")
+        Returns:
+            True if a pending pause was cancelled (SIMKL never saw it)
+        """
+        with self._pause_lock:
+            timer = self._pause_timer
+            self._pause_timer = None
+        if timer:
+            timer.cancel()
+            return True
+        return False
     
     def playback_resumed(self):
         """Handle playback resumed event."""
@@ -185,12 +312,18 @@ class SimklScrobbler:
         log(f"[scrobbler v{__version__}] SimklScrobbler.playback_resumed() Scrobble resumed")
         
         if self.is_paused:
-            pause_duration = time.time() - self.paused_at
+            pause_duration = time.monotonic() - self.paused_at
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_resumed() Was paused for {pause_duration:.1f} seconds")
         
         self.is_paused = False
+        self._active = True
         self.paused_at = 0
         
+        # Pause never reached SIMKL - it still thinks we're playing
+        if self._cancel_pending_pause():
+            log_debug(f"[scrobbler v{__version__}] SimklScrobbler.playback_resumed() Pause/resume flicker coalesced - no scrobbles sent")
+            return
+        
         # Resume scrobbling
         self._scrobble("start")
     
@@ -221,21 +354,27 @@ class SimklScrobbler:
         
         log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Playback ended")
         
+        # Stop supersedes any pause still waiting to be sent
+        self._cancel_pending_pause()
+        
         # Calculate final progress
         watched_percent = self._calculate_watched_percent()
         log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Final progress: {watched_percent:.1f}%")
         
-        # Send stop scrobble (always send this to end the session)
-        response = self._scrobble("stop")
-        log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Scrobble stop response: {'OK' if response else 'NONE/FAILED'}")
-        
         # Determine if content should be marked as watched
         # User's threshold from settings (default 70%)
-        threshold = get_setting_int("scrobble_threshold", 70)
+        threshold = self._settings.get("threshold", 70)
         meets_user_threshold = watched_percent >= threshold
         
+        # Send stop scrobble (always send this to end the session). When the
+        # user threshold is met, the /sync/history fallback payload is built
+        # up front and chained on the scrobble worker right after the stop,
+        # so we wait once for both instead of round-tripping in between.
+        history_payload = self._build_history_payload() if meets_user_threshold else None
+        response, history_result = self._scrobble_stop(history_payload)
+        log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Scrobble stop response: {'OK' if response else 'NONE/FAILED'}")
+        
         # SIMKL marks watched at 80%+ via /scrobble/stop, but ONLY if the API call succeeded
-        SIMKL_WATCHED_THRESHOLD = 80
         simkl_marked_watched = (response is not None) and (watched_percent >= SIMKL_WATCHED_THRESHOLD)
         
         was_marked_watched = False
@@ -247,12 +386,11 @@ class SimklScrobbler:
                 log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() SIMKL marked as watched via scrobble/stop ({watched_percent:.1f}% >= 80%)")
             else:
                 # Either scrobble/stop failed, or progress < 80% but user threshold met
-                # Use history API as fallback to explicitly mark watched
+                # The history API fallback was used to explicitly mark watched
                 if response is None:
-                    log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Scrobble/stop failed - using history API fallback to mark watched")
+                    log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Scrobble/stop failed - used history API fallback to mark watched")
                 else:
-                    log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Progress {watched_percent:.1f}% meets user threshold ({threshold}%) but below SIMKL's 80% - using history API fallback")
-                history_result = self._mark_watched_via_history()
+                    log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Progress {watched_percent:.1f}% meets user threshold ({threshold}%) but below SIMKL's 80% - used history API fallback")
                 if history_result:
                     was_marked_watched = True
                     log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Successfully marked as watched via history API")
@@ -266,7 +404,7 @@ class SimklScrobbler:
         if was_marked_watched:
             title = self._get_display_title()
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Marked as watched: {title}")
-            if get_setting_bool("show_notifications"):
+            if self._settings.get("show_notifications", False):
                 xbmc.sleep(5000)
                 log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Showing 'marked as watched' notification for: {title}")
                 notify(getString(MARKED_AS_WATCHED), title)
@@ -276,14 +414,18 @@ class SimklScrobbler:
         # Rating is triggered AFTER the scrobble completes
         # Copy data to locals BEFORE resetting state, because the rating dialog
         # is modal and new playback could start during it (autoplay)
-        should_rate = was_marked_watched and self.current_video and self.current_video_info
+        # Skip building rating info entirely when prompts are off for this type
+        rating_prompt = self._settings.get(
+            "rating_prompt_shows" if self._is_episode else "rating_prompt_movies", False)
+        should_rate = (was_marked_watched and self.current_video and self.current_video_info
+                       and rating_prompt)
         rating_media_type = None
         rating_media_info = None
         rating_watched_time = self.watched_time
         rating_total_time = self.video_duration
         
         if should_rate:
-            rating_media_type = self.current_video.get("type", "movie")
+            rating_media_type = self._media_type
             rating_media_info = self._build_rating_info()
             log(f"[scrobbler v{__version__}] SimklScrobbler.playback_ended() Rating info built: {rating_media_info}")
         
@@ -309,11 +451,14 @@ class SimklScrobbler:
             total_time: Total duration in seconds
         """
         try:
-            # Import here to avoid circular imports
-            from resources.lib.rating import rating_check
+            # Import on first use only (keeps rating/xbmcgui out of service
+            # startup), then reuse the cached function
+            if self._rating_check is None:
+                from resources.lib.rating import rating_check
+                self._rating_check = rating_check
             
             # Run the rating check (will show dialog if conditions are met)
-            rating_check(
+            self._rating_check(
                 media_type=media_type,
                 media_info=media_info,
                 watched_time=watched_time,
@@ -337,7 +482,7 @@ class SimklScrobbler:
         if not self.current_video or not self.current_video_info:
             return None
         
-        media_type = self.current_video.get("type", "movie")
+        media_type = self._media_type
         
         if media_type == "movie":
             # Start with IDs from SIMKL-formatted info
@@ -390,11 +535,11 @@ class SimklScrobbler:
         Args:
             is_seek: True if called due to a seek event
         """
-        if not self.is_playing or self.is_paused:
+        if not self._active:
             return
         
+        player = self._player
         try:
-            player = xbmc.Player()
             if not player.isPlayingVideo():
                 return
             
@@ -413,37 +558,42 @@ class SimklScrobbler:
             
             # Update watched time
             self.watched_time = player.getTime()
-            
-            now = time.time()
-            
-            # Do progress logging every 60 seconds
-            if now - self.last_transition_check >= 60:
-                self.last_transition_check = now
-                progress = self._calculate_watched_percent()
-                log(f"[scrobbler v{__version__}] SimklScrobbler.transition_check() Scrobble progress: {progress:.1f}%")
-            
-            # Send periodic progress update to SIMKL every 15 minutes.
-            # This re-sends a "start" scrobble to keep the SIMKL session alive
-            # and update the server-side progress percentage.
-            #
-            # Per SIMKL team feedback (Ennergizer, 2026-02-25): this is NOT needed
-            # by default. Kodi already sends pause/stop events which update SIMKL,
-            # and the transition_check() loop calls this every second already to
-            # detect multi-episode transitions. The periodic re-send is only useful
-            # for specific Kodi setups where playback events may not fire reliably.
-            #
-            # This is gated behind the "periodic_progress_update" setting (default: OFF)
-            # to avoid unnecessary API requests. Users who need it can enable it
-            # in Settings > Scrobbling > "Send periodic progress updates".
-            if get_setting_bool("periodic_progress_update") and now - self.last_progress_update >= 900:  # 900 seconds = 15 minutes
-                self.last_progress_update = now
-                progress = self._calculate_watched_percent()
-                log(f"[scrobbler v{__version__}] SimklScrobbler.transition_check() Periodic progress update enabled - sending scrobble/start to SIMKL at {progress:.1f}%")
-                self._scrobble("start")  # Re-sending "start" updates the progress on SIMKL
-                    
         except Exception as e:
             # This happens normally when playback stops
             log_debug(f"[scrobbler v{__version__}] SimklScrobbler.transition_check() Transition check exception (normal during stop): {e}")
+            return
+        
+        # Read the clocks into locals once; attributes are only written back
+        # when a timer actually fires
+        now = time.monotonic()
+        last_check = self.last_transition_check
+        last_update = self.last_progress_update
+        
+        # Do progress logging every 60 seconds
+        if now - last_check >= 60:
+            self.last_transition_check = now
+            progress = self._calculate_watched_percent()
+            log(f"[scrobbler v{__version__}] SimklScrobbler.transition_check() Scrobble progress: {progress:.1f}%")
+        
+        # Send periodic progress update to SIMKL every 15 minutes.
+        # This re-sends a "start" scrobble to keep the SIMKL session alive
+        # and update the server-side progress percentage.
+        #
+        # Per SIMKL team feedback (Ennergizer, 2026-02-25): this is NOT needed
+        # by default. Kodi already sends pause/stop events which update SIMKL,
+        # and the transition_check() loop calls this every second already to
+        # detect multi-episode transitions. The periodic re-send is only useful
+        # for specific Kodi setups where playback events may not fire reliably.
+        #
+        # This is gated behind the "periodic_progress_update" setting (default: OFF)
+        # to avoid unnecessary API requests. Users who need it can enable it
+        # in Settings > Scrobbling > "Send periodic progress updates".
+        # last_progress_update is maintained by _scrobble() so resumes and
+        # keepalives share one debounce clock.
+        if self._settings.get("periodic_progress_update", False) and now - last_update >= 900:  # 900 seconds = 15 minutes
+            progress = self._calculate_watched_percent()
+            log(f"[scrobbler v{__version__}] SimklScrobbler.transition_check() Periodic progress update enabled - sending scrobble/start to SIMKL at {progress:.1f}%")
+            self._scrobble("start")  # Re-sending "start" updates the progress on SIMKL
     
     def _identify_content(self, video_data):
         """
@@ -465,15 +615,19 @@ class SimklScrobbler:
             log_error(f"[scrobbler v{__version__}] SimklScrobbler._identify_content() No title available for identification")
             return None
         
+        identify = self._IDENTIFIERS.get(media_type)
+        if identify is None:
+            log_error(f"[scrobbler v{__version__}] SimklScrobbler._identify_content() Unsupported media type: {media_type}")
+            return None
+        
         try:
-            if media_type == "movie":
-                return self._identify_movie(video_data)
-            elif media_type == "episode":
-                return self._identify_episode(video_data)
-            else:
-                log_error(f"[scrobbler v{__version__}] SimklScrobbler._identify_content() Unsupported media type: {media_type}")
-                return None
-                
+            info = identify(self, video_data)
+            if info:
+                # Scrobble call shape is fixed once identified - build it once.
+                # Episode info is already {"show": ..., "episode": ...}.
+                self._scrobble_payload = info if media_type == "episode" else {"movie": info}
+            return info
+            
         except Exception as e:
             log_error(f"[scrobbler v{__version__}] SimklScrobbler._identify_content() Error identifying content: {e}")
             return None
@@ -498,7 +652,7 @@ class SimklScrobbler:
         filename = ""
         if file_path:
             # Get just the filename, not the full path
-            filename = file_path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+            filename = os.path.basename(file_path.replace("\\", "/"))
         
         # Build IDs dict if we have any
         ids = {}
@@ -621,95 +775,198 @@ class SimklScrobbler:
             "episode": episode_info
         }
     
-    def _scrobble(self, action):
+    # Media type -> identification method, used by _identify_content()
+    _IDENTIFIERS = {
+        "movie": _identify_movie,
+        "episode": _identify_episode,
+    }
+    
+    def _scrobble(self, action, on_done=None):
         """
-        Send scrobble to SIMKL API.
+        Queue a scrobble to SIMKL API.
+        
+        The request is snapshotted (info + progress) and handed to the
+        scrobble worker, so this returns without waiting on HTTP. Use
+        _scrobble_stop() when the response is needed.
+        
+        Back-to-back "start" scrobbles (no pause/stop in between) within
+        MIN_SCROBBLE_INTERVAL seconds are debounced and not sent at all.
         
         Args:
             action: "start", "pause", or "stop"
+            on_done: Optional callable(response) run on the worker afterwards
             
         Returns:
-            API response or None
+            True if the scrobble was queued, False if skipped
         """
         if not self.current_video_info:
             log_debug(f"[scrobbler v{__version__}] SimklScrobbler._scrobble() No current video info, skipping scrobble")
-            return None
+            return False
+        
+        now = time.monotonic()
+        if action == "start":
+            if (self._last_scrobble_action == "start"
+                    and now - self.last_progress_update < MIN_SCROBBLE_INTERVAL):
+                log_debug(f"[scrobbler v{__version__}] SimklScrobbler._scrobble() Debounced scrobble/start ({now - self.last_progress_update:.1f}s since last)")
+                return False
+            self.last_progress_update = now
+        self._last_scrobble_action = action
+        
+        # Snapshot now - _reset_state() may clear the live fields before the
+        # worker gets to this item. The payload itself is never mutated once
+        # built, so the reference is a safe snapshot.
+        progress = self._calculate_watched_percent()
+        
+        self._scrobble_queue.put((action, self._scrobble_payload, progress, on_done))
+        return True
+    
+    def _scrobble_stop(self, history_payload=None):
+        """
+        Queue scrobble/stop and wait for the worker to send it.
+        
+        The stop queues behind any pending start/pause so SIMKL sees the
+        events in order. If history_payload is given and the stop did not
+        mark the item watched (failed, or progress below SIMKL's 80%), the
+        worker sends it to /sync/history immediately afterwards.
+        
+        Args:
+            history_payload: add_to_history() kwargs from _build_history_payload(), or None
+            
+        Returns:
+            Tuple (stop response or None, history response or None).
+            (None, None) if the worker is gone or did not answer in time.
+        """
+        if self._closing or not self._scrobble_thread.is_alive():
+            log_warning(f"[scrobbler v{__version__}] SimklScrobbler._scrobble_stop() Scrobble worker not running, stop not sent")
+            return None, None
         
-        # Calculate progress
         progress = self._calculate_watched_percent()
+        done = threading.Event()
+        result = [None, None]
+        
+        def _stop_done(response):
+            try:
+                result[0] = response
+                if history_payload is not None and not (
+                        response is not None and progress >= SIMKL_WATCHED_THRESHOLD):
+                    result[1] = self._send_history(history_payload)
+            finally:
+                done.set()
+        
+        if not self._scrobble("stop", on_done=_stop_done):
+            return None, None
+        if not done.wait(STOP_WAIT_TIMEOUT):
+            log_warning(f"[scrobbler v{__version__}] SimklScrobbler._scrobble_stop() No response from scrobble worker after {STOP_WAIT_TIMEOUT}s")
+            return None, None
+        return result[0], result[1]
+    
+    def _scrobble_worker(self):
+        """
+        Background thread: send queued scrobbles to SIMKL in order.
+        
+        A None item stops the worker (see close()).
+        """
+        while True:
+            item = self._scrobble_queue.get()
+            if item is None:
+                break
+            action, payload, progress, on_done = item
+            response = self._send_scrobble(action, payload, progress)
+            if on_done:
+                try:
+                    on_done(response)
+                except Exception as e:
+                    log_error(f"[scrobbler v{__version__}] SimklScrobbler._scrobble_worker() Error in '{action}' completion: {e}")
+    
+    def close(self):
+        """
+        Stop the scrobble worker after it drains any queued requests.
         
-        media_type = self.current_video.get("type", "movie")
+        Returns:
+            bool: True if the worker exited, False if it is still sending
+        """
+        self._closing = True
+        self._scrobble_queue.put(None)
+        self._scrobble_thread.join(timeout=3)
+        return not self._scrobble_thread.is_alive()
+    
+    def _send_scrobble(self, action, payload, progress):
+        """
+        Send one scrobble request to SIMKL API (runs on the scrobble worker).
         
-        log(f"[scrobbler v{__version__}] SimklScrobbler._scrobble() _scrobble('{action}') at {progress:.1f}% | media_type={media_type}")
+        Args:
+            action: "start", "pause", or "stop"
+            payload: api.scrobble() content kwargs built in _identify_content()
+            progress: Watched percentage at the time the scrobble was queued
+            
+        Returns:
+            API response or None
+        """
+        log(f"[scrobbler v{__version__}] SimklScrobbler._send_scrobble() _scrobble('{action}') at {progress:.1f}% | content={'/'.join(payload)}")
         
         try:
-            if media_type == "movie":
-                return self.api.scrobble(
-                    action=action,
-                    movie=self.current_video_info,
-                    progress=progress
-                )
-            elif media_type == "episode":
-                return self.api.scrobble(
-                    action=action,
-                    show=self.current_video_info.get("show"),
-                    episode=self.current_video_info.get("episode"),
-                    progress=progress
-                )
-            else:
-                log_error(f"[scrobbler v{__version__}] SimklScrobbler._scrobble() Unknown media type for scrobble: {media_type}")
-                return None
-                
+            return self.api.scrobble(action=action, progress=progress, **payload)
         except Exception as e:
-            log_error(f"[scrobbler v{__version__}] SimklScrobbler._scrobble() Error sending scrobble: {e}")
+            log_error(f"[scrobbler v{__version__}] SimklScrobbler._send_scrobble() Error sending scrobble: {e}")
             return None
     
-    def _mark_watched_via_history(self):
+    def _build_history_payload(self):
         """
-        Mark current item as watched using the /sync/history endpoint.
+        Build the /sync/history request for the current item.
         
-        This is a fallback for when /scrobble/stop doesn't mark the item
+        Used as a fallback for when /scrobble/stop doesn't mark the item
         as watched (progress < 80%) but the user's configured threshold
         has been met. This matches the Trakt addon behavior.
         
         Returns:
-            API response dict or None on failure
+            Dict of api.add_to_history() kwargs, or None
         """
         if not self.current_video_info:
             return None
         
-        media_type = self.current_video.get("type", "movie")
+        media_type = self._media_type
         
-        try:
-            if media_type == "movie":
-                movie_obj = dict(self.current_video_info)
-                return self.api.add_to_history(movies=[movie_obj])
+        if media_type == "movie":
+            # No copy needed - the info dict is read-only once identified and
+            # api.add_to_history() only serializes it
+            return {"movies": [self.current_video_info]}
+        
+        elif media_type == "episode":
+            show_info = self.current_video_info.get("show", {})
+            episode_info = self.current_video_info.get("episode", {})
             
-            elif media_type == "episode":
-                show_info = self.current_video_info.get("show", {})
-                episode_info = self.current_video_info.get("episode", {})
-                
-                show_obj = {
-                    "title": show_info.get("title"),
-                    "ids": show_info.get("ids", {}),
-                    "seasons": [{
-                        "number": episode_info.get("season", 1),
-                        "episodes": [{
-                            "number": episode_info.get("number", 0)
-                        }]
+            show_obj = {
+                "title": show_info.get("title"),
+                "ids": show_info.get("ids", {}),
+                "seasons": [{
+                    "number": episode_info.get("season", 1),
+                    "episodes": [{
+                        "number": episode_info.get("number", 0)
                     }]
-                }
-                if show_info.get("year"):
-                    show_obj["year"] = show_info["year"]
-                
-                return self.api.add_to_history(shows=[show_obj])
+                }]
+            }
+            if show_info.get("year"):
+                show_obj["year"] = show_info["year"]
             
-            else:
-                log_error(f"[scrobbler v{__version__}] SimklScrobbler._mark_watched_via_history() Unknown media type for history fallback: {media_type}")
-                return None
-                
+            return {"shows": [show_obj]}
+        
+        log_error(f"[scrobbler v{__version__}] SimklScrobbler._build_history_payload() Unknown media type for history fallback: {media_type}")
+        return None
+    
+    def _send_history(self, history_payload):
+        """
+        Mark an item as watched using the /sync/history endpoint.
+        
+        Args:
+            history_payload: add_to_history() kwargs from _build_history_payload()
+            
+        Returns:
+            API response dict or None on failure
+        """
+        try:
+            return self.api.add_to_history(**history_payload)
         except Exception as e:
-            log_error(f"[scrobbler v{__version__}] SimklScrobbler._mark_watched_via_history() Error marking watched via history: {e}")
+            log_error(f"[scrobbler v{__version__}] SimklScrobbler._send_history() Error marking watched via history: {e}")
             return None
     
     def _calculate_watched_percent(self):
@@ -719,39 +976,27 @@ class SimklScrobbler:
         Returns:
             Float percentage (0-100)
         """
-        if self.video_duration <= 0:
-            return 0
-        
-        # Floor the duration for consistent calculation
-        floored_duration = math.floor(self.video_duration)
-        if floored_duration <= 0:
-            return 0
-        
-        return (self.watched_time / floored_duration) * 100
+        # video_duration is whole seconds (see playback_started)
+        return (self.watched_time * 100.0) / self.video_duration if self.video_duration > 0 else 0
     
     def _get_display_title(self):
-        """Get a nice display title for notifications."""
-        if not self.current_video:
-            return "Unknown"
-        
-        media_type = self.current_video.get("type", "movie")
-        title = self.current_video.get("title", "Unknown")
-        
-        if media_type == "episode":
-            show = self.current_video.get("show_title", title)
-            season = self.current_video.get("season", 0)
-            episode = self.current_video.get("episode", 0)
-            return f"{show} S{season:02d}E{episode:02d}"
-        
-        return title
+        """Get a nice display title for notifications (built once in playback_started)."""
+        return self._display_title or "Unknown"
     
     def _reset_state(self):
         """Reset scrobbler state after playback ends."""
+        self._cancel_pending_pause()
         self.is_playing = False
         self.is_paused = False
+        self._active = False
         self.current_video = None
         self.current_video_info = None
+        self._media_type = None
+        self._is_episode = False
+        self._display_title = None
+        self._scrobble_payload = None
         self.watched_time = 0
         self.video_duration = 1
         self.last_progress_update = 0
         self.paused_at = 0
+        self._last_scrobble_action = None
@@ -24,16 +24,18 @@ import xbmcaddon
 import xbmcgui
 import time
 import threading
-from collections import deque
+import traceback
+from queue import SimpleQueue, Empty
 
 # Import our modules
 from resources.lib.scrobbler import SimklScrobbler
 from resources.lib.api import SimklAPI
-from resources.lib.utils import log, log_error, log_debug, get_setting, get_setting_bool, get_setting_int
+from resources.lib.utils import log, log_error, log_warning, log_debug, refresh_debug_logging, get_setting, get_setting_bool, get_setting_int
 from resources.lib.exclusions import check_exclusion, get_exclusion_summary
 from resources.lib.sync import SyncManager
 from resources.lib.strings import (
     getString,
+    maybe_bump_locale,
     ADDON_NAME,
     READY_TO_SCROBBLE,
     NOT_AUTHENTICATED_CONFIGURE,
@@ -50,6 +52,15 @@ __version__ = '7.5.8'
 # Log module initialization
 xbmc.log(f'[SIMKL Scrobbler] service.py v{__version__} - Main service module loading', level=xbmc.LOGINFO)
 
+# Main loop waitForAbort() slices (seconds). Player/Monitor callbacks are
+# delivered during the wait but only processed after it, so the idle slice
+# also bounds how long a playback start or settings change waits.
+PLAYING_WAIT = 1.0
+IDLE_WAIT = 5.0
+
+# How often the main loop checks whether a scheduled sync is due (seconds)
+SCHEDULED_SYNC_CHECK_INTERVAL = 60.0
+
 
 class SimklService:
     """
@@ -59,18 +70,32 @@ class SimklService:
     all components and routes events between them.
     """
     
-    def __init__(self):
-        """Initialize the service and all components."""
-        self.dispatch_queue = deque()
+    def __init__(self, addon=None):
+        """
+        Initialize the service and all components.
+        
+        Args:
+            addon: Optional xbmcaddon.Addon instance to reuse for settings access
+        """
+        self._addon = addon if addon is not None else xbmcaddon.Addon('script.simkl.scrobbler')
+        # Filled from Kodi callbacks; the main loop drains it with get_nowait()
+        # after each waitForAbort() and never blocks on it
+        self.dispatch_queue = SimpleQueue()
         self.scrobbler = None
+        self._dispatch_table = {}
         self.player = None
         self.monitor = None
         self._running = False
         self._sync_in_progress = False
-        self._sync_thread = None
+        self._sync_thread = None                  # Persistent sync worker, started on first sync
+        self._sync_requests = SimpleQueue()
+        self._sync_lock = threading.Lock()  # Held from trigger until _run_sync_thread finishes
+        self._sync_manager = None           # Created on first sync, reused until shutdown
         self._last_sync_time = None
         self._library_scan_in_progress = False   # True while Kodi library scan is running
         self._startup_sync_pending = False        # True if startup sync was deferred due to active scan
+        self._next_sync_check = time.monotonic() + SCHEDULED_SYNC_CHECK_INTERVAL
+        self._cached_interval_hours = None        # Parsed auto_sync_interval, reset on settings change
         self._init_activity_timestamps()
         self._load_last_sync_time()
         log(f"[service v{__version__}] SimklService.__init__() SimklService initialized - ready to scrobble!")
@@ -79,54 +104,86 @@ class SimklService:
         """
         Add an event to the dispatch queue.
         
+        Never blocks; the main loop picks the event up after its current
+        waitForAbort() slice.
+        
         Args:
             data: Dict containing action and any associated data
         """
-        log_debug(f"[service v{__version__}] SimklService._dispatch_to_queue() Queuing dispatch: {data}")
-        self.dispatch_queue.append(data)
+        log_debug("[service v%s] SimklService._dispatch_to_queue() Queuing dispatch: %s", __version__, data)
+        self.dispatch_queue.put(data)
+    
+    def _build_dispatch_table(self):
+        """
+        Map dispatch actions to their handlers.
+        
+        Built once the scrobbler exists. Every handler takes the dispatched
+        data dict, which must be treated as read-only.
+        
+        Returns:
+            dict: action name -> handler callable
+        """
+        scrobbler = self.scrobbler
+        return {
+            # Playback started - identify and start scrobbling
+            "started": self._on_started,
+            # Playback stopped/ended - finalize scrobble
+            "stopped": lambda data: scrobbler.playback_ended(),
+            "ended": lambda data: scrobbler.playback_ended(),
+            # Playback paused - tell SIMKL we're taking a break
+            "paused": lambda data: scrobbler.playback_paused(),
+            # Playback resumed - back to watching!
+            "resumed": lambda data: scrobbler.playback_resumed(),
+            # User seeked - update progress
+            "seek": lambda data: scrobbler.playback_seek(),
+            # Settings changed - might need to reload something
+            "settings_changed": self._on_settings_changed,
+        }
+    
+    def _on_started(self, data):
+        """
+        Handle a started dispatch.
+        
+        Hands the scrobbler a copy without the action key; dispatched
+        data is read-only.
+        
+        Args:
+            data: Dict with 'action' and the video data from the player
+        """
+        payload = {k: v for k, v in data.items() if k != "action"}
+        self.scrobbler.playback_started(payload)
+    
+    def _on_settings_changed(self, data):
+        """
+        Handle a settings_changed dispatch.
+        
+        Args:
+            data: Dict with 'action' (unused)
+        """
+        log(f"[service v{__version__}] SimklService._process_dispatch() Settings changed - checking for auth triggers")
+        self._check_auth_triggers()
+        self.scrobbler.reload_settings()
+        refresh_debug_logging()
     
     def _process_dispatch(self, data):
         """
         Process a dispatched event from the queue.
         
         This is where the magic happens - events from the player
-        get translated into scrobbler actions.
+        get translated into scrobbler actions via the dispatch table.
         
         Args:
             data: Dict with 'action' key and any associated data
         """
         try:
             action = data.get("action")
-            log_debug(f"[service v{__version__}] SimklService._process_dispatch() Processing dispatch: {action}")
+            log_debug("[service v%s] SimklService._process_dispatch() Processing dispatch: %s", __version__, action)
             
-            if action == "started":
-                # Playback started - identify and start scrobbling
-                del data["action"]
-                self.scrobbler.playback_started(data)
-                
-            elif action == "stopped" or action == "ended":
-                # Playback stopped/ended - finalize scrobble
-                self.scrobbler.playback_ended()
-                
-            elif action == "paused":
-                # Playback paused - tell SIMKL we're taking a break
-                self.scrobbler.playback_paused()
-                
-            elif action == "resumed":
-                # Playback resumed - back to watching!
-                self.scrobbler.playback_resumed()
-                
-            elif action == "seek":
-                # User seeked - update progress
-                self.scrobbler.playback_seek()
-                
-            elif action == "settings_changed":
-                # Settings changed - might need to reload something
-                log(f"[service v{__version__}] SimklService._process_dispatch() Settings changed - checking for auth triggers")
-                self._check_auth_triggers()
-                
+            handler = self._dispatch_table.get(action)
+            if handler:
+                handler(data)
             else:
-                log_debug(f"[service v{__version__}] SimklService._process_dispatch() Unknown dispatch action: {action}")
+                log_debug("[service v%s] SimklService._process_dispatch() Unknown dispatch action: %s", __version__, action)
                 
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._process_dispatch() Error processing dispatch: {e}")
@@ -135,12 +192,13 @@ class SimklService:
         """
         Check if auth state changed and refresh API token if needed.
         """
-        import threading
         tid = threading.current_thread().name
         log(f"[service v{__version__}] SimklService._check_auth_triggers() | thread={tid}")
         if self.scrobbler and hasattr(self.scrobbler, 'api'):
             self.scrobbler.api.refresh_token()
             log(f"[service v{__version__}] SimklService._check_auth_triggers() Refreshed API token after settings change")
+        # Re-read the scheduled sync interval on the next check
+        self._cached_interval_hours = None
     
     def _init_activity_timestamps(self):
         """
@@ -153,21 +211,25 @@ class SimklService:
         it early in startup prevents dozens of noisy debug messages.
         """
         try:
-            addon = xbmcaddon.Addon('script.simkl.scrobbler')
+            addon = self._addon
             existing = addon.getSetting('simkl_activity_timestamps')
             if not existing:
                 addon.setSetting('simkl_activity_timestamps', '{}')
                 log(f"[service v{__version__}] SimklService._init_activity_timestamps() Initialized empty activity timestamps")
         except Exception as e:
-            log_debug(f"[service v{__version__}] SimklService._init_activity_timestamps() Could not initialize: {e}")
+            log_debug("[service v%s] SimklService._init_activity_timestamps() Could not initialize: %s", __version__, e)
     
     def _load_last_sync_time(self):
         """Load the last sync timestamp from addon settings."""
         try:
-            addon = xbmcaddon.Addon('script.simkl.scrobbler')
+            addon = self._addon
             last_sync_str = addon.getSetting('last_auto_sync_time')
             if last_sync_str:
-                self._last_sync_time = float(last_sync_str)
+                # Stored as integer seconds; older versions wrote a float string
+                try:
+                    self._last_sync_time = float(int(last_sync_str))
+                except ValueError:
+                    self._last_sync_time = float(last_sync_str)
                 log(f"[service v{__version__}] SimklService._load_last_sync_time() Loaded last sync time: {time.ctime(self._last_sync_time)}")
             else:
                 self._last_sync_time = None
@@ -179,9 +241,11 @@ class SimklService:
     def _save_last_sync_time(self):
         """Save the current sync timestamp to addon settings."""
         try:
-            addon = xbmcaddon.Addon('script.simkl.scrobbler')
-            self._last_sync_time = time.time()
-            addon.setSetting('last_auto_sync_time', str(self._last_sync_time))
+            addon = self._addon
+            # Whole seconds are plenty for an interval measured in hours
+            timestamp = int(time.time())
+            self._last_sync_time = float(timestamp)
+            addon.setSetting('last_auto_sync_time', str(timestamp))
             log(f"[service v{__version__}] SimklService._save_last_sync_time() Saved last sync time: {time.ctime(self._last_sync_time)}")
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._save_last_sync_time() Error saving last sync time: {e}")
@@ -193,7 +257,7 @@ class SimklService:
         This runs once at startup to let the user know
         if they're authenticated or not.
         """
-        addon = xbmcaddon.Addon('script.simkl.scrobbler')
+        addon = self._addon
         
         try:
             access_token = addon.getSetting('access_token')
@@ -232,28 +296,41 @@ class SimklService:
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._check_auth_status_on_startup() Error checking auth status: {e}")
     
-    def _check_scheduled_sync(self):
+    def _get_interval_hours(self):
         """
-        Check if it's time for a scheduled sync and trigger if needed.
+        Get the scheduled sync interval in hours (parsed once, then cached).
         
-        Returns True if sync was triggered, False otherwise.
+        The cache is cleared by _check_auth_triggers() when settings change.
+        
+        Returns:
+            int: Interval in hours, 0 if scheduled sync is off
         """
-        try:
-            # Get interval setting (in hours, 0 = off)
+        if self._cached_interval_hours is None:
             # Note: This is a <select> setting - getSettingInt returns the index,
             # not the value. Use get_setting() to get the actual option value text.
             interval_str = get_setting('auto_sync_interval')
             try:
-                interval_hours = int(interval_str) if interval_str else 0
+                self._cached_interval_hours = int(interval_str) if interval_str else 0
             except (ValueError, TypeError):
-                interval_hours = 0
+                self._cached_interval_hours = 0
+        return self._cached_interval_hours
+    
+    def _check_scheduled_sync(self):
+        """
+        Check if it's time for a scheduled sync and trigger if needed.
+        
+        Returns True if sync was triggered, False otherwise.
+        """
+        try:
+            # Get interval setting (in hours, 0 = off)
+            interval_hours = self._get_interval_hours()
             
             if interval_hours == 0:
                 return False  # Scheduled sync is disabled
             
             # Check if sync is already in progress
             if self._sync_in_progress:
-                log_debug(f"[service v{__version__}] SimklService._check_scheduled_sync() Sync already in progress, skipping scheduled check")
+                log_debug("[service v%s] SimklService._check_scheduled_sync() Sync already in progress, skipping scheduled check", __version__)
                 return False
             
             # Check if enough time has passed
@@ -272,17 +349,34 @@ class SimklService:
                 return True
             else:
                 remaining = interval_hours - elapsed_hours
-                log_debug(f"[service v{__version__}] SimklService._check_scheduled_sync() Next scheduled sync in {remaining:.1f} hours")
+                log_debug("[service v%s] SimklService._check_scheduled_sync() Next scheduled sync in %.1f hours", __version__, remaining)
                 return False
                 
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._check_scheduled_sync() Error checking scheduled sync: {e}")
             return False
     
-    def _trigger_scheduled_sync(self):
-        """Trigger a scheduled sync in background thread."""
+    def _trigger_sync(self, start_msg_id, label):
+        """
+        Queue a full bidirectional sync on the background worker.
+        
+        Shared by the scheduled and library triggers: takes the sync lock,
+        shows the "starting" notification and hands the sync to the worker.
+        
+        Args:
+            start_msg_id (int): String ID for the "sync starting" notification
+            label (str): Short name of the trigger for log messages
+        """
         show_notifications = False
+        lock_held = False
         try:
+            # Only one background sync at a time - released by _run_sync_thread
+            if not self._sync_lock.acquire(blocking=False):
+                log(f"[service v{__version__}] SimklService._trigger_sync() {label} sync: sync already running - skipping")
+                return
+            lock_held = True
+            self._sync_in_progress = True
+            
             # Check if notifications are enabled
             show_notifications = get_setting_bool('show_library_sync_notifications')
             
@@ -290,20 +384,22 @@ class SimklService:
             if show_notifications:
                 xbmcgui.Dialog().notification(
                     getString(ADDON_NAME),
-                    getString(STARTING_SYNC_SCHEDULED),
+                    getString(start_msg_id),
                     xbmcgui.NOTIFICATION_INFO,
                     3000
                 )
             
-            # Run sync in background thread
-            sync_thread = threading.Thread(target=self._run_sync_thread)
-            sync_thread.daemon = True
-            sync_thread.start()
+            # Hand the sync to the background worker
+            self._submit_sync()
+            lock_held = False  # Now owned by the sync worker
             
-            log(f"[service v{__version__}] SimklService._trigger_scheduled_sync() Scheduled sync thread started")
+            log(f"[service v{__version__}] SimklService._trigger_sync() {label} sync queued (thread={self._sync_thread.name})")
             
         except Exception as e:
-            log_error(f"[service v{__version__}] SimklService._trigger_scheduled_sync() Error triggering scheduled sync: {e}")
+            log_error(f"[service v{__version__}] SimklService._trigger_sync() Error triggering {label.lower()} sync: {e}")
+            if lock_held:
+                self._sync_in_progress = False
+                self._sync_lock.release()
             if show_notifications:
                 xbmcgui.Dialog().notification(
                     getString(ADDON_NAME),
@@ -312,6 +408,10 @@ class SimklService:
                     5000
                 )
     
+    def _trigger_scheduled_sync(self):
+        """Trigger a scheduled sync in background thread."""
+        self._trigger_sync(STARTING_SYNC_SCHEDULED, "Scheduled")
+    
     def _trigger_library_sync(self):
         """
         Trigger a full bidirectional sync in background thread.
@@ -319,7 +419,6 @@ class SimklService:
         This runs sync in a separate thread to avoid blocking
         Kodi's library operations.
         """
-        show_notifications = False
         try:
             # Check if any sync (manual or background) is already in progress
             # Uses window property for cross-process visibility (manual sync in scripts sets this too)
@@ -329,7 +428,6 @@ class SimklService:
             
             # Check if a sync completed very recently (within 30s) to avoid redundant syncs
             # This prevents onScanFinished from re-syncing right after startup/manual sync
-            import time
             last_completed = xbmcgui.Window(10000).getProperty('simkl.sync_completed_at')
             if last_completed:
                 try:
@@ -339,36 +437,35 @@ class SimklService:
                         return
                 except (ValueError, TypeError):
                     pass
-            
-            # Check if notifications are enabled
-            show_notifications = get_setting_bool('show_library_sync_notifications')
-            
-            # Show notification that sync is starting (if enabled)
-            if show_notifications:
-                xbmcgui.Dialog().notification(
-                    getString(ADDON_NAME),
-                    getString(STARTING_SYNC_LIBRARY),
-                    xbmcgui.NOTIFICATION_INFO,
-                    3000
-                )
-            
-            # Run sync in background thread
-            sync_thread = threading.Thread(target=self._run_sync_thread, name="SIMKL-Sync")
-            sync_thread.daemon = True
-            sync_thread.start()
-            self._sync_thread = sync_thread
-            
-            log(f"[service v{__version__}] SimklService._trigger_library_sync() Library sync thread started (thread={sync_thread.name})")
-            
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._trigger_library_sync() Error triggering library sync: {e}")
-            if show_notifications:
-                xbmcgui.Dialog().notification(
-                    getString(ADDON_NAME),
-                    getString(SYNC_FAILED).format(str(e)),
-                    xbmcgui.NOTIFICATION_ERROR,
-                    5000
-                )
+            return
+        
+        self._trigger_sync(STARTING_SYNC_LIBRARY, "Library")
+    
+    def _submit_sync(self):
+        """
+        Queue a sync for the background worker, starting the worker if needed.
+        
+        A single daemon worker thread is reused for every sync instead of
+        creating a new thread each time. Callers must hold self._sync_lock;
+        _run_sync_thread releases it when the sync finishes.
+        """
+        if self._sync_thread is None or not self._sync_thread.is_alive():
+            self._sync_thread = threading.Thread(target=self._sync_worker, name="SIMKL-Sync")
+            self._sync_thread.daemon = True
+            self._sync_thread.start()
+        self._sync_requests.put(True)
+    
+    def _sync_worker(self):
+        """
+        Background worker that runs queued syncs until a None sentinel arrives.
+        """
+        while True:
+            request = self._sync_requests.get()
+            if request is None:
+                break
+            self._run_sync_thread()
     
     def _run_sync_thread(self):
         """
@@ -376,8 +473,18 @@ class SimklService:
         
         This method runs in a separate thread to avoid blocking.
         """
-        sync_manager = None
+        cfg = {'show_library_sync_notifications': False}
         try:
+            # Snapshot sync settings once so a mid-sync settings change can't
+            # leave the export and import phases disagreeing
+            cfg = {key: get_setting_bool(key) for key in (
+                'show_library_sync_notifications',
+                'sync_movies_from_kodi',
+                'sync_episodes_from_kodi',
+                'sync_movies_to_kodi',
+                'sync_episodes_to_kodi',
+            )}
+            
             # Mark sync as in progress (instance var + window property for cross-process visibility)
             self._sync_in_progress = True
             xbmcgui.Window(10000).setProperty('simkl.sync_in_progress', 'true')
@@ -387,13 +494,16 @@ class SimklService:
             
             log(f"[service v{__version__}] SimklService._run_sync_thread() Running full bidirectional sync in background...")
             
-            # Check if notifications are enabled
-            show_notifications = get_setting_bool('show_library_sync_notifications')
-            
-            # Create sync manager
+            # Create the sync manager once and reuse it so its API session keeps
+            # its connections alive between syncs.
             # silent=True because service.py handles all user-facing notifications
             # SyncManager's own notifications would duplicate the service ones
-            sync_manager = SyncManager(show_progress=False, silent=True)
+            if self._sync_manager is None:
+                self._sync_manager = SyncManager(show_progress=False, silent=True)
+            else:
+                self._sync_manager.reset_stats()
+                self._sync_manager.api.refresh_token()
+            sync_manager = self._sync_manager
             
             # Run bidirectional sync and capture stats
             # Check if manual sync has requested cancellation
@@ -403,8 +513,8 @@ class SimklService:
             
             # Sync TO SIMKL (export Kodi watched items)
             sync_manager.sync_to_simkl(
-                sync_movies=get_setting_bool('sync_movies_from_kodi'),
-                sync_episodes=get_setting_bool('sync_episodes_from_kodi')
+                sync_movies=cfg['sync_movies_from_kodi'],
+                sync_episodes=cfg['sync_episodes_from_kodi']
             )
             
             # Check cancel again between export and import
@@ -414,8 +524,8 @@ class SimklService:
             
             # Sync FROM SIMKL (import SIMKL watched items)
             sync_manager.sync_from_simkl(
-                sync_movies=get_setting_bool('sync_movies_to_kodi'),
-                sync_episodes=get_setting_bool('sync_episodes_to_kodi')
+                sync_movies=cfg['sync_movies_to_kodi'],
+                sync_episodes=cfg['sync_episodes_to_kodi']
             )
             
             # Refresh episode/movie sync state to reflect items just imported.
@@ -453,7 +563,7 @@ class SimklService:
                 message = getString(SYNC_COMPLETE_NO_CHANGES)
             
             # Show completion notification (if enabled)
-            if show_notifications:
+            if cfg['show_library_sync_notifications']:
                 xbmcgui.Dialog().notification(
                     getString(ADDON_NAME),
                     message,
@@ -468,11 +578,9 @@ class SimklService:
                 
         except Exception as e:
             log_error(f"[service v{__version__}] SimklService._run_sync_thread() Error in sync thread: {e}")
-            # Import traceback for detailed error logging
-            import traceback
             log_error(f"[service v{__version__}] SimklService._run_sync_thread() Traceback: {traceback.format_exc()}")
             
-            if show_notifications:
+            if cfg['show_library_sync_notifications']:
                 xbmcgui.Dialog().notification(
                     getString(ADDON_NAME),
                     getString(SYNC_FAILED).format(str(e)),
@@ -480,16 +588,12 @@ class SimklService:
                     5000
                 )
         finally:
-            # Always clean up - critical for preventing file locks on uninstall
-            if sync_manager:
-                sync_manager.close()
-                log(f"[service v{__version__}] SimklService._run_sync_thread() Sync manager closed")
+            # Always clean up (the shared sync manager is closed on shutdown)
             self._sync_in_progress = False
-            self._sync_thread = None
             xbmcgui.Window(10000).clearProperty('simkl.sync_in_progress')
             xbmcgui.Window(10000).clearProperty('simkl.sync_cancel')
-            import time
             xbmcgui.Window(10000).setProperty('simkl.sync_completed_at', str(time.time()))
+            self._sync_lock.release()
             log(f"[service v{__version__}] SimklService._run_sync_thread() Sync thread finished")
     
     def run(self):
@@ -499,7 +603,7 @@ class SimklService:
         Runs continuously until Kodi requests shutdown:
         1. Processes events from dispatch queue
         2. Does transition checks during playback
-        3. Waits a bit before checking again
+        3. Waits in waitForAbort() so Kodi can deliver Player/Monitor callbacks
         """
         log(f"[service v{__version__}] SimklService.run() SIMKL Service starting main loop...")
         self._running = True
@@ -522,8 +626,7 @@ class SimklService:
         self._check_auth_status_on_startup()
         
         # Trigger startup sync if enabled and authenticated
-        addon = xbmcaddon.Addon('script.simkl.scrobbler')
-        if get_setting_bool('sync_on_startup') and addon.getSetting('access_token'):
+        if get_setting_bool('sync_on_startup') and self._addon.getSetting('access_token'):
             if self._library_scan_in_progress:
                 # Kodi is still scanning on boot - defer until onScanFinished fires
                 log(f"[service v{__version__}] SimklService.run() Sync on startup deferred - library scan in progress")
@@ -535,61 +638,82 @@ class SimklService:
         # Initialize scrobbler with API
         api = SimklAPI()
         self.scrobbler = SimklScrobbler(api)
+        self._dispatch_table = self._build_dispatch_table()
         
         # Initialize player with callback to our dispatch queue
-        self.player = SimklPlayer(action=self._dispatch_to_queue)
+        self.player = SimklPlayer(
+            action=self._dispatch_to_queue,
+            service=self
+        )
         
         log(f"[service v{__version__}] SimklService.run() Service initialized - entering main loop")
         
-        # Track loop iterations for scheduled sync checking
-        loop_count = 0
-        
         # Main service loop
         while not self.monitor.abortRequested():
-            # Process any queued events
-            while self.dispatch_queue and not self.monitor.abortRequested():
-                data = self.dispatch_queue.popleft()
-                log_debug(f"[service v{__version__}] SimklService.run() Processing queued dispatch: {data}")
+            # Wait on this thread's monitor - Kodi only runs the Player and
+            # Monitor callbacks created here while it sits in waitForAbort(),
+            # so blocking anywhere else would starve the dispatch queue.
+            # Short slices while playing pace the transition checks.
+            timeout = PLAYING_WAIT if self.player._playing else IDLE_WAIT
+            timeout = min(timeout, max(0.0, self._next_sync_check - time.monotonic()))
+            if self.monitor.waitForAbort(timeout):
+                break
+            
+            # Process everything the callbacks queued during the wait
+            while True:
+                try:
+                    data = self.dispatch_queue.get_nowait()
+                except Empty:
+                    break
+                log_debug("[service v%s] SimklService.run() Processing queued dispatch: %s", __version__, data)
                 self._process_dispatch(data)
             
             # Do transition check if playing video
-            # This updates progress and handles multi-episode transitions
-            if xbmc.Player().isPlayingVideo():
+            # This updates progress and handles multi-episode transitions.
+            # _playing is checked first so the idle loop never calls into Kodi.
+            if self.player._playing and self.player.isPlayingVideo():
                 self.scrobbler.transition_check()
             
-            # Check for scheduled sync every 60 iterations (roughly every minute)
-            loop_count += 1
-            if loop_count >= 60:
+            # Check for scheduled sync once the check deadline has passed
+            now = time.monotonic()
+            if now >= self._next_sync_check:
                 self._check_scheduled_sync()
-                loop_count = 0
-            
-            # Wait 1 second before next iteration
-            # This gives us responsive event handling while not hammering CPU
-            if self.monitor.waitForAbort(1):
-                break
+                self._next_sync_check = now + SCHEDULED_SYNC_CHECK_INTERVAL
         
         # Cleanup
         log(f"[service v{__version__}] SimklService.run() Service shutting down...")
         self._running = False
         
-        # Wait for sync thread to finish (max 3 seconds) so it can clean up
-        # Capture reference locally to avoid race condition where _run_sync_thread's
-        # finally block sets self._sync_thread = None between join() and is_alive()
+        # Stop the sync worker, waiting for a running sync to finish (max 3 seconds)
+        # so it can clean up
         sync_thread_ref = self._sync_thread
         if sync_thread_ref and sync_thread_ref.is_alive():
-            log(f"[service v{__version__}] SimklService.run() Waiting for sync thread to finish...")
+            self._sync_requests.put(None)
+            if self._sync_in_progress:
+                log(f"[service v{__version__}] SimklService.run() Waiting for sync thread to finish...")
             sync_thread_ref.join(timeout=3)
             if sync_thread_ref.is_alive():
                 log_warning(f"[service v{__version__}] SimklService.run() Sync thread did not finish in time")
         
         # Close API session to free socket connections (prevents file locks on uninstall)
         if hasattr(self, 'scrobbler') and self.scrobbler and hasattr(self.scrobbler, 'api'):
-            self.scrobbler.api.close()
-            log(f"[service v{__version__}] SimklService.run() Scrobbler API session closed")
+            if self.scrobbler.close():
+                self.scrobbler.api.close()
+                log(f"[service v{__version__}] SimklService.run() Scrobbler API session closed")
+            else:
+                # A stop/history request is still in flight on the worker -
+                # closing the session under it would fail that request
+                log_warning(f"[service v{__version__}] SimklService.run() Scrobble worker still busy, leaving API session open")
+        
+        # Close the shared sync manager - critical for preventing file locks on uninstall
+        if self._sync_manager:
+            self._sync_manager.close()
+            log(f"[service v{__version__}] SimklService.run() Sync manager closed")
         
         if self.player:
             del self.player
         if self.monitor:
+            self.monitor.cancel_pending()
             del self.monitor
         
         log(f"[service v{__version__}] SimklService.run() Service stopped")
@@ -603,19 +727,41 @@ class SimklPlayer(xbmc.Player):
     reports back to the service via the dispatch callback.
     """
     
+    # Constant-shape events are dispatched as shared dicts - consumers
+    # must treat dispatched data as read-only.
+    _EVT_STOPPED = {"action": "stopped"}
+    _EVT_ENDED = {"action": "ended"}
+    _EVT_PAUSED = {"action": "paused"}
+    _EVT_RESUMED = {"action": "resumed"}
+    _EVT_SEEK = {"action": "seek"}
+    
     def __init__(self, *args, **kwargs):
         """
         Initialize player monitor.
         
         Args:
             action: Callback function to dispatch events
+            service: Reference to parent SimklService instance
         """
         super(SimklPlayer, self).__init__()
         self.action = kwargs.get("action")
+        self.service = kwargs.get("service")
         self._playing = False
         self._current_file = None
         log(f"[service v{__version__}] SimklPlayer.__init__() SimklPlayer initialized")
     
+    def _can_dispatch(self):
+        """
+        Check whether player events should be handled at all.
+        
+        Returns:
+            False if there is no callback or the service is shutting down
+        """
+        if not self.action:
+            return False
+        monitor = self.service.monitor if self.service else None
+        return not (monitor and monitor.abortRequested())
+    
     def onAVStarted(self):
         """
         Called when Kodi starts playing audio/video.
@@ -623,17 +769,31 @@ class SimklPlayer(xbmc.Player):
         This is THE moment we've been waiting for!
         Time to figure out what's playing and start scrobbling.
         """
-        # Give Kodi a moment to settle
-        xbmc.sleep(1000)
+        if not self._can_dispatch():
+            return
+        
+        # Give Kodi a moment to settle - poll until the playing file is
+        # available instead of blocking the player thread for a full second
+        playing_file = None
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            if self.isPlayingVideo():
+                try:
+                    playing_file = self.getPlayingFile()
+                except Exception:
+                    playing_file = None
+                if playing_file:
+                    break
+            xbmc.sleep(50)
         
         # Only care about video
-        if not self.isPlayingVideo():
-            log_debug(f"[service v{__version__}] SimklPlayer.onAVStarted() Not playing video, ignoring")
+        if not playing_file:
+            log_debug("[service v%s] SimklPlayer.onAVStarted() Not playing video, ignoring", __version__)
             return
         
         try:
             # Get the file being played
-            self._current_file = self.getPlayingFile()
+            self._current_file = playing_file
             log(f"[service v{__version__}] SimklPlayer.onAVStarted() Video playback started: {self._current_file}")
             
             # Check exclusions (PVR, HTTP streams, etc.)
@@ -655,31 +815,31 @@ class SimklPlayer(xbmc.Player):
     
     def onPlayBackStopped(self):
         """Called when user manually stops playback."""
-        if self._playing:
+        if self._playing and self._can_dispatch():
             log(f"[service v{__version__}] SimklPlayer.onPlayBackStopped() Playback stopped by user")
             self._playing = False
             self._current_file = None
-            self.action({"action": "stopped"})
+            self.action(SimklPlayer._EVT_STOPPED)
     
     def onPlayBackEnded(self):
         """Called when playback ends naturally."""
-        if self._playing:
+        if self._playing and self._can_dispatch():
             log(f"[service v{__version__}] SimklPlayer.onPlayBackEnded() Playback ended naturally")
             self._playing = False
             self._current_file = None
-            self.action({"action": "ended"})
+            self.action(SimklPlayer._EVT_ENDED)
     
     def onPlayBackPaused(self):
         """Called when user pauses playback."""
-        if self._playing:
+        if self._playing and self._can_dispatch():
             log(f"[service v{__version__}] SimklPlayer.onPlayBackPaused() Playback paused")
-            self.action({"action": "paused"})
+            self.action(SimklPlayer._EVT_PAUSED)
     
     def onPlayBackResumed(self):
         """Called when playback resumes from pause."""
-        if self._playing:
+        if self._playing and self._can_dispatch():
             log(f"[service v{__version__}] SimklPlayer.onPlayBackResumed() Playback resumed")
-            self.action({"action": "resumed"})
+            self.action(SimklPlayer._EVT_RESUMED)
     
     def onPlayBackSeek(self, *args):
         """
@@ -690,9 +850,9 @@ class SimklPlayer(xbmc.Player):
         - Kodi 20+: (time_sec, offset_sec) in seconds
         Values are logged but not used for scrobble logic.
         """
-        if self._playing:
+        if self._playing and self._can_dispatch():
             log(f"[service v{__version__}] SimklPlayer.onPlayBackSeek() Playback seek detected")
-            self.action({"action": "seek"})
+            self.action(SimklPlayer._EVT_SEEK)
     
     def _should_exclude(self, file_path):
         """
@@ -751,17 +911,22 @@ class SimklPlayer(xbmc.Player):
             imdb_id = None
             raw_imdb = info_tag.getIMDBNumber()
             
+            # Collect all unique IDs in one pass
+            uids = {}
+            for key in ("imdb", "tvdb", "tmdb"):
+                try:
+                    uids[key] = info_tag.getUniqueID(key) or None
+                except Exception:
+                    uids[key] = None
+            
             # First try the more reliable getUniqueID("imdb")
-            try:
-                unique_imdb = info_tag.getUniqueID("imdb")
-                if unique_imdb:
-                    # Ensure tt prefix
-                    if unique_imdb.startswith("tt"):
-                        imdb_id = unique_imdb
-                    elif unique_imdb.isdigit():
-                        imdb_id = f"tt{unique_imdb}"
-            except:
-                pass
+            unique_imdb = uids["imdb"]
+            if unique_imdb:
+                # Ensure tt prefix
+                if unique_imdb.startswith("tt"):
+                    imdb_id = unique_imdb
+                elif unique_imdb.isdigit():
+                    imdb_id = f"tt{unique_imdb}"
             
             # Fall back to getIMDBNumber() only if it looks like a real IMDb ID
             if not imdb_id and raw_imdb:
@@ -772,26 +937,17 @@ class SimklPlayer(xbmc.Player):
             if imdb_id:
                 video_data["imdb_id"] = imdb_id
             
-            # Try to get other IDs via uniqueid
-            try:
-                tvdb_id = info_tag.getUniqueID("tvdb")
-                if tvdb_id:
-                    video_data["tvdb_id"] = tvdb_id
-            except:
-                pass
-            
-            try:
-                tmdb_id = info_tag.getUniqueID("tmdb")
-                if tmdb_id:
-                    video_data["tmdb_id"] = str(tmdb_id)
-            except:
-                pass
+            # Other IDs from uniqueid
+            if uids["tvdb"]:
+                video_data["tvdb_id"] = uids["tvdb"]
+            if uids["tmdb"]:
+                video_data["tmdb_id"] = str(uids["tmdb"])
             
             # If getIMDBNumber() returned a pure number (likely TMDb ID) and 
             # we don't have a TMDb ID yet, use it as TMDb
             if not video_data.get("tmdb_id") and raw_imdb and raw_imdb.isdigit():
                 video_data["tmdb_id"] = raw_imdb
-                log_debug(f"[service v{__version__}] SimklPlayer._get_video_data() Using getIMDBNumber() value '{raw_imdb}' as TMDb ID (pure numeric, no tt prefix)")
+                log_debug("[service v%s] SimklPlayer._get_video_data() Using getIMDBNumber() value '%s' as TMDb ID (pure numeric, no tt prefix)", __version__, raw_imdb)
             
             # TV-specific info
             if media_type == "episode":
@@ -815,6 +971,11 @@ class SimklMonitor(xbmc.Monitor):
     Watches for settings changes, library updates, etc.
     """
     
+    # Kodi fires onSettingsChanged once per changed setting; only act on
+    # the last change in a burst.
+    SETTINGS_DEBOUNCE = 0.5
+    _EVT_SETTINGS_CHANGED = {"action": "settings_changed"}
+    
     def __init__(self, *args, **kwargs):
         """
         Initialize monitor.
@@ -826,12 +987,37 @@ class SimklMonitor(xbmc.Monitor):
         super(SimklMonitor, self).__init__()
         self.action = kwargs.get("action")
         self.service = kwargs.get("service")
+        self._settings_timer = None
+        self._settings_lock = threading.Lock()
         log(f"[service v{__version__}] SimklMonitor.__init__() SimklMonitor initialized")
     
     def onSettingsChanged(self):
         """Called when addon settings are changed."""
         log(f"[service v{__version__}] SimklMonitor.onSettingsChanged() Settings changed detected")
-        self.action({"action": "settings_changed"})
+        
+        # Localized strings are memoized - drop them if the language changed
+        if maybe_bump_locale():
+            log(f"[service v{__version__}] SimklMonitor.onSettingsChanged() Language changed - cleared string cache")
+        
+        with self._settings_lock:
+            if self._settings_timer:
+                self._settings_timer.cancel()
+            self._settings_timer = threading.Timer(self.SETTINGS_DEBOUNCE, self._dispatch_settings_changed)
+            self._settings_timer.daemon = True
+            self._settings_timer.start()
+    
+    def _dispatch_settings_changed(self):
+        """Dispatch a single settings_changed event once a burst of changes settles."""
+        with self._settings_lock:
+            self._settings_timer = None
+        self.action(self._EVT_SETTINGS_CHANGED)
+    
+    def cancel_pending(self):
+        """Cancel a pending debounced settings_changed dispatch (used on shutdown)."""
+        with self._settings_lock:
+            if self._settings_timer:
+                self._settings_timer.cancel()
+                self._settings_timer = None
     
     def onScanStarted(self, database):
         """
@@ -905,7 +1091,7 @@ def main():
     # Log exclusion settings summary
     log(get_exclusion_summary())
     
-    service = SimklService()
+    service = SimklService(addon)
     service.run()
     
     log(f"[service v{__version__}] SimklMonitor.main() " + "=" * 50)
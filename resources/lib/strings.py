@@ -13,20 +13,30 @@ Professional code - Project 4 standards
 
 import xbmc
 import xbmcaddon
+import functools
+import sys
 
 # Module version
 __version__ = '7.5.5'
 
-# Log module initialization
-xbmc.log(f'[SIMKL Scrobbler] strings.py v{__version__} - Localization helper loading', level=xbmc.LOGINFO)
+# Log module initialization (debug only - this module is imported by every entry point)
+xbmc.log('[SIMKL Scrobbler] strings.py v' + __version__ + ' - Localization helper loading', level=xbmc.LOGDEBUG)
 
-# Cache the addon instance
+# Cache the addon instance and its bound lookup method
 _addon = xbmcaddon.Addon('script.simkl.scrobbler')
+_get_localized = _addon.getLocalizedString
 
+# Language the string caches were built for; updated by maybe_bump_locale()
+_language = xbmc.getLanguage()
 
-def getString(string_id):
+
+def _fetch_string(string_id):
     """
-    Get a localized string by ID.
+    Fetch a localized string (uncached).
+    
+    Known IDs come from the table built at import; anything else is
+    looked up in Kodi. Results are interned so repeated labels share
+    one string object.
     
     Args:
         string_id (int): String ID from strings.po
@@ -34,7 +44,64 @@ def getString(string_id):
     Returns:
         str: Localized string
     """
-    return _addon.getLocalizedString(string_id)
+    index = string_id - _MIN_ID
+    if 0 <= index < _TABLE_SIZE:
+        text = _TABLE[index]
+        if text:
+            return text
+    return sys.intern(_get_localized(string_id))
+
+
+# Get a localized string by ID. Results are memoized - strings only change
+# with the Kodi language, see reset_locale_cache().
+getString = functools.lru_cache(maxsize=256)(_fetch_string)
+
+
+@functools.lru_cache(maxsize=32)
+def getStrings(ids):
+    """
+    Get several localized strings at once.
+    
+    Handy for dialogs that set many labels on open; repeated calls with
+    the same IDs return the same prebuilt tuple.
+    
+    Args:
+        ids (tuple): String IDs from strings.po - must be a tuple, not a list
+        
+    Returns:
+        tuple: Localized strings, in the same order as ids
+    """
+    return tuple(getString(string_id) for string_id in ids)
+
+
+def reset_locale_cache():
+    """
+    Re-resolve all known strings and drop memoized lookups.
+    
+    Call this when the Kodi language changes.
+    """
+    _precompute_strings()
+    getString.cache_clear()
+    getStrings.cache_clear()
+
+
+def maybe_bump_locale():
+    """
+    Reset the string caches only if the Kodi language actually changed.
+    
+    Cheap enough to call on every settings change - the caches survive
+    unless the language is different from the one they were built for.
+    
+    Returns:
+        bool: True if the language changed and the caches were reset
+    """
+    global _language
+    language = xbmc.getLanguage()
+    if language == _language:
+        return False
+    _language = language
+    reset_locale_cache()
+    return True
 
 
 # ============================================================================
@@ -79,6 +146,57 @@ RATING_GREAT = 32837
 RATING_EXCELLENT = 32838
 RATING_LEGENDARY = 32839
 
+# Every ID above - resolved once at import by _precompute_strings()
+_KNOWN_IDS = (
+    AUTH_STATUS,
+    NOW_SCROBBLING, MARKED_AS_WATCHED, SCROBBLE_FAILED, READY_TO_SCROBBLE,
+    NOT_AUTHENTICATED_CONFIGURE, STARTING_SYNC_LIBRARY, STARTING_SYNC_SCHEDULED,
+    SYNC_COMPLETE_COUNTS, SYNC_COMPLETE_NO_CHANGES, SYNC_FAILED, ADDON_NAME, SIMKL,
+    RATE_TITLE, CURRENT_RATING, CLICK_STAR, SELECT_RATING_FIRST, RATED_AS,
+    SUBMIT_RATING_FAILED, RATING_DESC_FORMAT,
+    RATING_TRAIN_WRECK, RATING_TERRIBLE, RATING_POOR, RATING_BELOW_AVERAGE,
+    RATING_AVERAGE, RATING_DECENT, RATING_GOOD, RATING_GREAT, RATING_EXCELLENT,
+    RATING_LEGENDARY,
+)
+
+# Rating value (1-10) -> description string ID; index 0 is unused
+_RATING_IDS = (
+    None,
+    RATING_TRAIN_WRECK,
+    RATING_TERRIBLE,
+    RATING_POOR,
+    RATING_BELOW_AVERAGE,
+    RATING_AVERAGE,
+    RATING_DECENT,
+    RATING_GOOD,
+    RATING_GREAT,
+    RATING_EXCELLENT,
+    RATING_LEGENDARY,
+)
+_VALID_RATINGS = range(1, len(_RATING_IDS))
+
+# Known strings live in a dense list indexed by (string_id - _MIN_ID);
+# IDs in the gaps between declared constants stay None.
+_MIN_ID = min(_KNOWN_IDS)
+_TABLE_SIZE = max(_KNOWN_IDS) - _MIN_ID + 1
+
+# Filled in by _precompute_strings()
+_TABLE = [None] * _TABLE_SIZE
+_RATING_DESCS = ()
+
+
+def _precompute_strings():
+    """Resolve every known string ID (and the rating descriptions) for the current language."""
+    global _TABLE, _RATING_DESCS
+    table = [None] * _TABLE_SIZE
+    for string_id in _KNOWN_IDS:
+        table[string_id - _MIN_ID] = sys.intern(_get_localized(string_id))
+    _TABLE = table
+    _RATING_DESCS = ("",) + tuple(table[string_id - _MIN_ID] for string_id in _RATING_IDS[1:])
+
+
+_precompute_strings()
+
 
 def get_rating_description(rating):
     """
@@ -90,20 +208,4 @@ def get_rating_description(rating):
     Returns:
         str: Localized rating description
     """
-    rating_strings = {
-        1: RATING_TRAIN_WRECK,
-        2: RATING_TERRIBLE,
-        3: RATING_POOR,
-        4: RATING_BELOW_AVERAGE,
-        5: RATING_AVERAGE,
-        6: RATING_DECENT,
-        7: RATING_GOOD,
-        8: RATING_GREAT,
-        9: RATING_EXCELLENT,
-        10: RATING_LEGENDARY
-    }
-    
-    string_id = rating_strings.get(rating)
-    if string_id:
-        return getString(string_id)
-    return ""
+    return _RATING_DESCS[int(rating)] if rating in _VALID_RATINGS else ""
@@ -21,28 +21,63 @@ Attribution: Claude.ai with assistance from Michael Beck
 
 import json
 import time
+import zlib
+import base64
+import hashlib
+import functools
+from itertools import chain, groupby
+from concurrent.futures import ThreadPoolExecutor
 import xbmc
 import xbmcgui
 from datetime import datetime, timezone
 from resources.lib.utils import (
     log, log_error, log_debug, log_warning,
-    get_setting_bool, notify
+    get_setting_bool, notify, refresh_debug_logging
 )
 from resources.lib.api import SimklAPI
 
+# Prefer orjson for the big JSON-RPC payloads when it's installed; the
+# stdlib json module is the fallback (and all a stock Kodi install has)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = functools.partial(json.dumps, separators=(',', ':'))
+
 # Module version
 __version__ = '7.5.8'
 
 # Log module initialization
 xbmc.log(f'[SIMKL Scrobbler] sync.py v{__version__} - Sync manager module loading', level=xbmc.LOGINFO)
 
+# Max requests per JSON-RPC batch array sent to Kodi
+RPC_BATCH_SIZE = 200
+
+# Rows fetched per page from VideoLibrary.GetMovies/GetEpisodes
+KODI_PAGE_SIZE = 500
+
+# Concurrent add_to_history uploads during export (kept low for SIMKL rate limits)
+EXPORT_WORKERS = 3
+
+# Minimum seconds between progress dialog iscanceled() polls
+CANCEL_CHECK_INTERVAL = 0.25
+
+# Prefix marking a compressed sync state blob (legacy state is plain JSON)
+_STATE_BLOB_PREFIX = 'z1:'
 
+
+@functools.lru_cache(maxsize=4096)
 def _kodi_time_to_utc_iso(kodi_timestamp):
     """
     Convert Kodi's local time string to UTC ISO 8601 format.
     
     Kodi stores lastplayed as "YYYY-MM-DD HH:MM:SS" in local time.
     SIMKL expects ISO 8601 with "Z" suffix meaning UTC.
+    Memoized - binge-watched items often share a timestamp.
     
     Args:
         kodi_timestamp: String like "2026-01-15 20:30:00"
@@ -51,19 +86,86 @@ def _kodi_time_to_utc_iso(kodi_timestamp):
         UTC ISO string like "2026-01-15T22:30:00Z" or None on failure
     """
     try:
-        # Parse as local time (naive datetime)
-        local_dt = datetime.strptime(kodi_timestamp, "%Y-%m-%d %H:%M:%S")
-        # Attach local timezone info
-        local_dt = local_dt.replace(tzinfo=datetime.now(timezone.utc).astimezone().tzinfo)
-        # Convert to UTC
-        utc_dt = local_dt.astimezone(timezone.utc)
+        # Parse the fixed-width "YYYY-MM-DD HH:MM:SS" as local time (naive datetime)
+        ts = kodi_timestamp
+        local_dt = datetime(
+            int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+            int(ts[11:13]), int(ts[14:16]), int(ts[17:19])
+        )
+        # Convert to UTC - astimezone() treats a naive datetime as system
+        # local time, using the UTC offset in effect on that date (DST-aware)
+        u = local_dt.astimezone(timezone.utc)
         # Format as ISO 8601 with Z suffix
-        return utc_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return f"{u.year:04d}-{u.month:02d}-{u.day:02d}T{u.hour:02d}:{u.minute:02d}:{u.second:02d}Z"
     except Exception as e:
         log_warning(f"[sync v{__version__}] _kodi_time_to_utc_iso() Failed to convert timestamp '{kodi_timestamp}': {e}")
         return None
 
 
+def _encode_state(state_json):
+    """
+    Pack serialized sync state into a compact string for storing in a setting.
+    
+    Args:
+        state_json (str): Sync state as JSON text
+        
+    Returns:
+        str: Prefixed base64 of the zlib-compressed JSON
+    """
+    raw = state_json.encode('utf-8')
+    return _STATE_BLOB_PREFIX + base64.b64encode(zlib.compress(raw)).decode('ascii')
+
+
+def _state_digest(state_json):
+    """
+    Fingerprint serialized sync state so unchanged libraries can be spotted.
+    
+    Args:
+        state_json (str): Sync state as JSON text
+        
+    Returns:
+        str: Hex digest
+    """
+    return hashlib.blake2b(state_json.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _decode_state(blob):
+    """
+    Unpack a sync state string written by _encode_state().
+    
+    Plain JSON saved by older versions is still accepted.
+    
+    Args:
+        blob (str): Stored setting value
+        
+    Returns:
+        dict: Sync state
+    """
+    if blob.startswith(_STATE_BLOB_PREFIX):
+        blob = zlib.decompress(base64.b64decode(blob[len(_STATE_BLOB_PREFIX):])).decode('utf-8')
+    return _json_loads(blob)
+
+
+def _normalize_uniqueids(items):
+    """
+    Make sure tmdb/tvdb uniqueids on Kodi items are strings, in place.
+    
+    Done once when the library is fetched so the index builders and
+    matchers can compare IDs without calling str() on every lookup.
+    
+    Args:
+        items (list): Kodi media items
+    """
+    for item in items:
+        uniqueid = item.get("uniqueid")
+        if not uniqueid:
+            continue
+        for key in ("tmdb", "tvdb"):
+            value = uniqueid.get(key)
+            if value is not None and not isinstance(value, str):
+                uniqueid[key] = str(value)
+
+
 class SyncManager:
     """
     Manages synchronization between Kodi and SIMKL.
@@ -72,7 +174,7 @@ class SyncManager:
     your Kodi library and SIMKL account are saying the same things.
     """
     
-    def __init__(self, show_progress=False, silent=False, force_full_sync=False):
+    def __init__(self, show_progress=False, silent=False, force_full_sync=False, max_workers=EXPORT_WORKERS):
         """
         Initialize the sync manager.
         
@@ -80,6 +182,7 @@ class SyncManager:
             show_progress (bool): Show progress dialog during sync
             silent (bool): Suppress notifications (for background sync)
             force_full_sync (bool): Skip delta detection, sync ALL watched items
+            max_workers (int): Export batches uploaded to SIMKL concurrently
         """
         # Create API with fresh token read to avoid stale cache on background threads
         import xbmcaddon
@@ -87,8 +190,12 @@ class SyncManager:
             fresh_addon = xbmcaddon.Addon('script.simkl.scrobbler')
             token = fresh_addon.getSetting('access_token')
         except Exception:
+            fresh_addon = None
             token = None
         
+        # Kept for the sync state reads/writes below
+        self._addon = fresh_addon
+        
         self.api = SimklAPI()
         # Override with fresh token if the default read got nothing
         if token and not self.api.access_token:
@@ -98,10 +205,24 @@ class SyncManager:
             })
             log(f"[sync v{__version__}] SyncManager.__init__() Injected fresh token into SyncManager API (len={len(token)})")
         
+        # Pick up the current debug_logging setting for this run
+        refresh_debug_logging()
+        
         self.show_progress = show_progress
         self.silent = silent
         self.force_full_sync = force_full_sync
+        self.max_workers = max(1, max_workers)
         self.progress_dialog = None
+        self._last_cancel_check = 0.0
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """
+        Reset per-run stats and the cancel flag.
+        
+        Lets a long-lived SyncManager be reused for several syncs while
+        keeping its API session (and HTTP keep-alive connections).
+        """
         self.cancelled = False
         
         # Stats for reporting
@@ -119,6 +240,33 @@ class SyncManager:
             'errors': 0
         }
     
+    def _update_progress(self, percent, message):
+        """
+        Update the progress dialog, if one is shown, and check for cancel.
+        
+        The iscanceled() poll is rate-limited to once per
+        CANCEL_CHECK_INTERVAL since each call round-trips to the GUI thread.
+        
+        Args:
+            percent (int): Progress percentage (0-100)
+            message (str): Progress message
+            
+        Returns:
+            bool: True if the user has cancelled the sync
+        """
+        if self.progress_dialog is None:
+            return False
+        
+        self.progress_dialog.update(percent, message)
+        
+        now = time.monotonic()
+        if now - self._last_cancel_check >= CANCEL_CHECK_INTERVAL:
+            self._last_cancel_check = now
+            if self.progress_dialog.iscanceled():
+                self.cancelled = True
+        
+        return self.cancelled
+    
     def _notify(self, title, message):
         """Show notification unless silent mode is active."""
         if not self.silent:
@@ -323,32 +471,53 @@ class SyncManager:
             dict: Previous sync state or empty dict
         """
         try:
-            import xbmcaddon
-            addon = xbmcaddon.Addon('script.simkl.scrobbler')
             key = self._get_sync_state_key(category)
-            state_json = addon.getSetting(key)
+            state_json = self._addon.getSetting(key)
             
-            if state_json:
-                return json.loads(state_json)
-            return {}
+            if not state_json:
+                return {}
+            
+            state = _decode_state(state_json)
+            if category == 'episodes':
+                # Stored as "show_id:season:episode" strings, keyed in memory by tuple
+                state = {
+                    tuple(int(part) for part in key.split(':')): playcount
+                    for key, playcount in state.items()
+                }
+            return state
         except Exception as e:
             log_debug(f"[sync v{__version__}] SyncManager._load_sync_state() Could not load sync state for {category}: {e}")
             return {}
     
+    def _dump_sync_state(self, category, state):
+        """
+        Serialize a sync state to the JSON text that gets stored.
+        
+        Args:
+            category (str): 'movies' or 'episodes'
+            state (dict): Sync state (episode keys are tuples)
+            
+        Returns:
+            str: JSON text
+        """
+        if category == 'episodes':
+            # JSON object keys must be strings
+            state = {f"{k[0]}:{k[1]}:{k[2]}": v for k, v in state.items()}
+        return _json_dumps(state)
+    
     def _save_sync_state(self, category, state):
         """
         Save current sync state to settings.
         
         Args:
             category (str): 'movies' or 'episodes'
-            state (dict): Sync state to save
+            state (dict): Sync state to save (episode keys are tuples)
         """
         try:
-            import xbmcaddon
-            addon = xbmcaddon.Addon('script.simkl.scrobbler')
+            state_json = self._dump_sync_state(category, state)
             key = self._get_sync_state_key(category)
-            state_json = json.dumps(state)
-            addon.setSetting(key, state_json)
+            self._addon.setSetting(key, _encode_state(state_json))
+            self._addon.setSetting(key + '_hash', _state_digest(state_json))
             log_debug(f"[sync v{__version__}] SyncManager._save_sync_state() Saved sync state for {category}")
         except Exception as e:
             log_error(f"[sync v{__version__}] SyncManager._save_sync_state() Failed to save sync state for {category}: {e}")
@@ -363,19 +532,7 @@ class SyncManager:
         Returns:
             dict: {movie_id: playcount} for all movies with IDs
         """
-        state = {}
-        for movie in movies:
-            # Use IMDb ID as primary key (most reliable)
-            movie_id = None
-            if movie.get('uniqueid', {}).get('imdb'):
-                movie_id = movie['uniqueid']['imdb']
-            elif movie.get('imdbnumber', '').startswith('tt'):
-                movie_id = movie['imdbnumber']
-            
-            if movie_id:
-                state[movie_id] = movie.get('playcount', 0)
-        
-        return state
+        return self._index_movies(movies)[0]
     
     def _build_episode_state(self, episodes):
         """
@@ -385,93 +542,97 @@ class SyncManager:
             episodes (list): List of Kodi episodes
             
         Returns:
-            dict: {show_id:season:episode: playcount}
+            dict: {(show_id, season, episode): playcount}
         """
-        state = {}
-        for ep in episodes:
-            tvshowid = ep.get('tvshowid')
-            season = ep.get('season', 0)
-            episode = ep.get('episode', 0)
-            
-            if tvshowid is not None:
-                key = f"{tvshowid}:{season}:{episode}"
-                state[key] = ep.get('playcount', 0)
-        
-        return state
+        return self._index_episodes(episodes)[0]
     
-    def _find_changed_movies(self, current_movies, last_state):
+    def _index_movies(self, current_movies):
         """
-        Find movies that have changed since last sync.
+        Build the delta sync state for the current movie list.
         
         Args:
             current_movies (list): Current movie list
-            last_state (dict): Previous sync state
             
         Returns:
-            list: Movies that have changed
+            tuple: ({movie_id: playcount} state dict, [(movie_id, movie), ...])
         """
-        if not last_state:
-            log(f"[sync v{__version__}] SyncManager._find_changed_movies() No previous sync state - syncing all movies")
-            return current_movies
-        
-        changed = []
-        current_state = self._build_movie_state(current_movies)
+        new_state = {}
+        keyed = []
         
         for movie in current_movies:
-            movie_id = None
-            if movie.get('uniqueid', {}).get('imdb'):
-                movie_id = movie['uniqueid']['imdb']
-            elif movie.get('imdbnumber', '').startswith('tt'):
-                movie_id = movie['imdbnumber']
-            
-            if not movie_id:
-                continue
-            
-            current_playcount = current_state.get(movie_id, 0)
-            last_playcount = last_state.get(movie_id, -1)
+            # Use IMDb ID as primary key (most reliable)
+            ids = self._extract_ids(movie)
+            movie_id = ids.get('imdb') if ids else None
             
-            # Changed if: new movie, or playcount changed
-            if last_playcount == -1 or current_playcount != last_playcount:
-                changed.append(movie)
+            if movie_id:
+                new_state[movie_id] = movie.get('playcount', 0)
+                keyed.append((movie_id, movie))
         
-        log(f"[sync v{__version__}] SyncManager._find_changed_movies() Delta sync: {len(changed)} of {len(current_movies)} movies changed")
-        return changed
+        return new_state, keyed
     
-    def _find_changed_episodes(self, current_episodes, last_state):
+    def _index_episodes(self, current_episodes):
         """
-        Find episodes that have changed since last sync.
+        Build the delta sync state for the current episode list.
         
         Args:
             current_episodes (list): Current episode list
-            last_state (dict): Previous sync state
             
         Returns:
-            list: Episodes that have changed
+            tuple: ({(show_id, season, episode): playcount} state dict, [(key, episode), ...])
         """
-        if not last_state:
-            log(f"[sync v{__version__}] SyncManager._find_changed_episodes() No previous sync state - syncing all episodes")
-            return current_episodes
-        
-        changed = []
-        current_state = self._build_episode_state(current_episodes)
+        new_state = {}
+        keyed = []
         
         for ep in current_episodes:
             tvshowid = ep.get('tvshowid')
-            season = ep.get('season', 0)
-            episode = ep.get('episode', 0)
-            
-            if tvshowid is None:
-                continue
             
-            key = f"{tvshowid}:{season}:{episode}"
-            current_playcount = current_state.get(key, 0)
-            last_playcount = last_state.get(key, -1)
+            if tvshowid is not None:
+                key = (tvshowid, ep.get('season', 0), ep.get('episode', 0))
+                new_state[key] = ep.get('playcount', 0)
+                keyed.append((key, ep))
+        
+        return new_state, keyed
+    
+    def _find_changed(self, category, current_items, new_state, keyed):
+        """
+        Find items that have changed since last sync.
+        
+        Compares a digest of the new state with the one stored at the last
+        save first, so an unchanged library never loads the old state.
+        Otherwise the changed keys are a set difference of the two states'
+        (key, playcount) pairs.
+        
+        Args:
+            category (str): 'movies' or 'episodes'
+            current_items (list): Current Kodi items
+            new_state (dict): State built by _index_movies/_index_episodes
+            keyed (list): (key, item) pairs from the same call
             
-            # Changed if: new episode, or playcount changed
-            if last_playcount == -1 or current_playcount != last_playcount:
-                changed.append(ep)
+        Returns:
+            list: Changed items (all of them on a full sync), or None if
+                  nothing changed since the last saved state
+        """
+        if self.force_full_sync:
+            log(f"[sync v{__version__}] SyncManager._find_changed() FULL SYNC forced - skipping delta detection for {category}")
+            return current_items
+        
+        state_json = self._dump_sync_state(category, new_state)
+        last_digest = self._addon.getSetting(self._get_sync_state_key(category) + '_hash') if self._addon else ''
+        if _state_digest(state_json) == last_digest:
+            log(f"[sync v{__version__}] SyncManager._find_changed() No {category} changed since last sync")
+            return None
+        
+        last_state = self._load_sync_state(category)
+        if not last_state:
+            log(f"[sync v{__version__}] SyncManager._find_changed() No previous sync state - syncing all {category}")
+            return current_items
+        
+        # Changed if: new item, or playcount changed
+        changed_keys = {key for key, _ in new_state.items() - last_state.items()}
+        changed = [item for key, item in keyed if key in changed_keys]
+        
+        log(f"[sync v{__version__}] SyncManager._find_changed() Delta sync: {len(changed)} of {len(current_items)} {category} changed")
         
-        log(f"[sync v{__version__}] SyncManager._find_changed_episodes() Delta sync: {len(changed)} of {len(current_episodes)} episodes changed")
         return changed
     
     # ========== Kodi JSON-RPC Methods ==========
@@ -499,7 +660,7 @@ class SyncManager:
             request["params"] = params
         
         try:
-            response = json.loads(xbmc.executeJSONRPC(json.dumps(request)))
+            response = _json_loads(xbmc.executeJSONRPC(_json_dumps(request)))
             
             if "error" in response:
                 log_error(f"[sync v{__version__}] SyncManager._kodi_rpc() JSON-RPC error: {response['error']}")
@@ -514,6 +675,89 @@ class SyncManager:
             log_error(f"[sync v{__version__}] SyncManager._kodi_rpc() JSON-RPC exception: {e}")
             return None
     
+    def _kodi_rpc_paged(self, method, params, list_key):
+        """
+        Fetch a full library list from Kodi in pages using JSON-RPC limits.
+        
+        Keeps each response (and its json.loads) small instead of pulling
+        the whole library in one huge reply.
+        
+        Args:
+            method (str): JSON-RPC method name (e.g. "VideoLibrary.GetMovies")
+            params (dict): Method parameters (without "limits")
+            list_key (str): Result key holding the rows (e.g. "movies")
+            
+        Returns:
+            list: All rows, or None if any page failed (never a partial list)
+                or the first page had no rows
+        """
+        items = []
+        start = 0
+        while True:
+            page_params = dict(params)
+            page_params["limits"] = {"start": start, "end": start + KODI_PAGE_SIZE}
+            result = self._kodi_rpc(method, page_params)
+            
+            if not result or list_key not in result:
+                if start:
+                    # A partial library would look like removals to delta sync
+                    log_error(f"[sync v{__version__}] SyncManager._kodi_rpc_paged() {method} page at {start} failed, discarding {len(items)} rows")
+                return None
+            
+            items.extend(result[list_key])
+            total = result.get("limits", {}).get("total", 0)
+            start += KODI_PAGE_SIZE
+            if start >= total:
+                return items
+    
+    def _kodi_rpc_batch(self, calls):
+        """
+        Execute many Kodi JSON-RPC requests using JSON-RPC batch arrays.
+        
+        Sends up to RPC_BATCH_SIZE requests per executeJSONRPC() call
+        instead of one round-trip per request.
+        
+        Args:
+            calls (list): (method, params) tuples
+            
+        Returns:
+            list: Result for each call, in order (None where a call failed)
+        """
+        results = [None] * len(calls)
+        
+        for start in range(0, len(calls), RPC_BATCH_SIZE):
+            batch = []
+            for request_id, (method, params) in enumerate(calls[start:start + RPC_BATCH_SIZE], start):
+                request = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": method
+                }
+                if params:
+                    request["params"] = params
+                batch.append(request)
+            
+            try:
+                responses = _json_loads(xbmc.executeJSONRPC(_json_dumps(batch)))
+            except Exception as e:
+                log_error(f"[sync v{__version__}] SyncManager._kodi_rpc_batch() JSON-RPC batch exception: {e}")
+                continue
+            
+            # A malformed batch gets a single error object back instead of a list
+            if not isinstance(responses, list):
+                log_error(f"[sync v{__version__}] SyncManager._kodi_rpc_batch() JSON-RPC batch error: {responses.get('error')}")
+                continue
+            
+            for response in responses:
+                if "error" in response:
+                    log_error(f"[sync v{__version__}] SyncManager._kodi_rpc_batch() JSON-RPC error (id={response.get('id')}): {response['error']}")
+                    continue
+                request_id = response.get("id")
+                if isinstance(request_id, int) and 0 <= request_id < len(results):
+                    results[request_id] = response.get("result")
+        
+        return results
+    
     def get_kodi_movies(self):
         """
         Get all movies from Kodi library with watch status.
@@ -523,7 +767,7 @@ class SyncManager:
         """
         log(f"[sync v{__version__}] SyncManager.get_kodi_movies() Fetching movies from Kodi library...")
         
-        result = self._kodi_rpc("VideoLibrary.GetMovies", {
+        movies = self._kodi_rpc_paged("VideoLibrary.GetMovies", {
             "properties": [
                 "title",
                 "year",
@@ -531,17 +775,16 @@ class SyncManager:
                 "uniqueid",
                 "playcount",
                 "lastplayed",
-                "file",
-                "runtime",
                 "userrating"
             ]
-        })
+        }, "movies")
         
-        if not result or "movies" not in result:
+        if not movies:
             log_warning(f"[sync v{__version__}] SyncManager.get_kodi_movies() No movies found in Kodi library")
             return []
         
-        movies = result["movies"]
+        _normalize_uniqueids(movies)
+        
         log(f"[sync v{__version__}] SyncManager.get_kodi_movies() Found {len(movies)} movies in Kodi library")
         
         return movies
@@ -555,27 +798,24 @@ class SyncManager:
         """
         log(f"[sync v{__version__}] SyncManager.get_kodi_episodes() Fetching TV episodes from Kodi library...")
         
-        result = self._kodi_rpc("VideoLibrary.GetEpisodes", {
+        episodes = self._kodi_rpc_paged("VideoLibrary.GetEpisodes", {
             "properties": [
-                "title",
                 "showtitle",
                 "season",
                 "episode",
                 "uniqueid",
                 "playcount",
                 "lastplayed",
-                "file",
-                "runtime",
-                "tvshowid",
-                "userrating"
+                "tvshowid"
             ]
-        })
+        }, "episodes")
         
-        if not result or "episodes" not in result:
+        if not episodes:
             log_warning(f"[sync v{__version__}] SyncManager.get_kodi_episodes() No TV episodes found in Kodi library")
             return []
         
-        episodes = result["episodes"]
+        _normalize_uniqueids(episodes)
+        
         log(f"[sync v{__version__}] SyncManager.get_kodi_episodes() Found {len(episodes)} episodes in Kodi library")
         
         return episodes
@@ -604,6 +844,7 @@ class SyncManager:
             return {}
         
         # Create lookup by tvshowid
+        _normalize_uniqueids(result["tvshows"])
         shows = {}
         for show in result["tvshows"]:
             shows[show["tvshowid"]] = show
@@ -620,41 +861,42 @@ class SyncManager:
         
         Kodi stores IDs in various places depending on how the media was scraped.
         This method tries to find IMDb, TMDb, or TVDB IDs wherever they hide.
+        The result is cached on the item as "_simkl_ids", so later passes
+        over the same item don't redo the lookups.
         
         Args:
             item (dict): Kodi media item
             
         Returns:
-            dict: SIMKL-formatted IDs object
+            dict: SIMKL-formatted IDs object, or None if there are none
         """
+        # Already worked out on an earlier pass over this item
+        if "_simkl_ids" in item:
+            return item["_simkl_ids"]
+        
         ids = {}
         
         # Check uniqueid dict (modern Kodi)
-        if "uniqueid" in item and item["uniqueid"]:
-            uniqueid = item["uniqueid"]
-            
-            if "imdb" in uniqueid and uniqueid["imdb"]:
-                ids["imdb"] = uniqueid["imdb"]
-            
-            if "tmdb" in uniqueid and uniqueid["tmdb"]:
-                ids["tmdb"] = str(uniqueid["tmdb"])
-            
-            if "tvdb" in uniqueid and uniqueid["tvdb"]:
-                ids["tvdb"] = str(uniqueid["tvdb"])
+        uniqueid = item.get("uniqueid") or {}
+        if imdb := uniqueid.get("imdb"):
+            ids["imdb"] = imdb
+        if tmdb := uniqueid.get("tmdb"):
+            ids["tmdb"] = tmdb
+        if tvdb := uniqueid.get("tvdb"):
+            ids["tvdb"] = tvdb
         
         # Check imdbnumber field (older Kodi / fallback)
-        if "imdbnumber" in item and item["imdbnumber"]:
-            imdb = item["imdbnumber"]
-            
+        if imdb := item.get("imdbnumber"):
             # IMDb IDs start with 'tt'
             if imdb.startswith("tt"):
                 ids["imdb"] = imdb
             # Otherwise might be TVDB ID (numeric)
-            elif imdb.isdigit():
-                if "tvdb" not in ids:
-                    ids["tvdb"] = imdb
+            elif imdb.isdigit() and "tvdb" not in ids:
+                ids["tvdb"] = imdb
         
-        return ids if ids else None
+        ids = ids or None
+        item["_simkl_ids"] = ids
+        return ids
     
     # ========== Export: Kodi → SIMKL ==========
     
@@ -679,13 +921,13 @@ class SyncManager:
             log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() No movies to export")
             return 0
         
-        # Load last sync state and find changes (or use all if forced full sync)
-        if self.force_full_sync:
-            log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() FULL SYNC forced - skipping delta detection")
-            changed_movies = kodi_movies
-        else:
-            last_state = self._load_sync_state('movies')
-            changed_movies = self._find_changed_movies(kodi_movies, last_state)
+        # Find changes since last sync state (or use all if forced full sync)
+        current_state, keyed = self._index_movies(kodi_movies)
+        changed_movies = self._find_changed('movies', kodi_movies, current_state, keyed)
+        
+        if changed_movies is None:
+            # Identical to the state saved last time - nothing to send or save
+            return 0
         
         # Filter to watched movies only
         watched_movies = [m for m in changed_movies if m.get("playcount", 0) > 0]
@@ -694,7 +936,6 @@ class SyncManager:
         if not watched_movies:
             log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() No changed watched movies to export")
             # Still update sync state to track current state
-            current_state = self._build_movie_state(kodi_movies)
             self._save_sync_state('movies', current_state)
             return 0
         
@@ -735,33 +976,31 @@ class SyncManager:
         if not movies_to_send:
             log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() No movies with valid IDs to export")
             # Update sync state
-            current_state = self._build_movie_state(kodi_movies)
             self._save_sync_state('movies', current_state)
             return 0
         
         # Send to SIMKL in batches (API may have limits)
         batch_size = 100
         total_sent = 0
+        batches = [movies_to_send[i:i + batch_size] for i in range(0, len(movies_to_send), batch_size)]
         
-        for i in range(0, len(movies_to_send), batch_size):
-            batch = movies_to_send[i:i + batch_size]
-            
-            log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Sending batch {i // batch_size + 1}: {len(batch)} movies")
-            
-            result = self.api.add_to_history(movies=batch)
-            
+        # Batches are independent HTTPS round-trips - overlap a few of them
+        log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Sending {len(batches)} batches ({self.max_workers} at a time)")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            results = list(executor.map(lambda batch: self.api.add_to_history(movies=batch), batches))
+        
+        for batch_num, result in enumerate(results, 1):
             if result:
                 added = result.get("added", {}).get("movies", 0)
                 total_sent += added
-                log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Batch complete: {added} movies added to SIMKL")
+                log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Batch {batch_num} complete: {added} movies added to SIMKL")
             else:
-                log_error(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Failed to send batch to SIMKL")
+                log_error(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() Failed to send batch {batch_num} to SIMKL")
                 self.stats['errors'] += 1
         
         self.stats['movies_exported'] = total_sent
         
         # Save current sync state after successful export
-        current_state = self._build_movie_state(kodi_movies)
         self._save_sync_state('movies', current_state)
         
         log(f"[sync v{__version__}] SyncManager.export_movies_to_simkl() === Movie Export Complete: {total_sent} movies sent to SIMKL ===")
@@ -792,13 +1031,13 @@ class SyncManager:
             log(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() No episodes to export")
             return 0
         
-        # Load last sync state and find changes (or use all if forced full sync)
-        if self.force_full_sync:
-            log(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() FULL SYNC forced - skipping delta detection")
-            changed_episodes = kodi_episodes
-        else:
-            last_state = self._load_sync_state('episodes')
-            changed_episodes = self._find_changed_episodes(kodi_episodes, last_state)
+        # Find changes since last sync state (or use all if forced full sync)
+        current_state, keyed = self._index_episodes(kodi_episodes)
+        changed_episodes = self._find_changed('episodes', kodi_episodes, current_state, keyed)
+        
+        if changed_episodes is None:
+            # Identical to the state saved last time - nothing to send or save
+            return 0
         
         # Filter to watched episodes
         watched_episodes = [e for e in changed_episodes if e.get("playcount", 0) > 0]
@@ -807,66 +1046,70 @@ class SyncManager:
         if not watched_episodes:
             log(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() No changed watched episodes to export")
             # Still update sync state
-            current_state = self._build_episode_state(kodi_episodes)
             self._save_sync_state('episodes', current_state)
             return 0
         
-        # Group episodes by show
-        shows_data = {}  # show_id -> {show_info, episodes}
+        # Group episodes by show, then season - sorting first makes each
+        # (show, season) a single contiguous run for groupby()
+        shows_data = {}  # show_id -> {show_info, seasons}
         skipped = 0
         
-        for ep in watched_episodes:
+        def show_season(ep):
             tvshowid = ep.get("tvshowid")
+            return (-1 if tvshowid is None else tvshowid, ep.get("season", 0))
+        
+        def episode_obj(ep):
+            ep_obj = {
+                "number": ep.get("episode", 0)
+            }
+            
+            # Add watched_at if available
+            lastplayed = ep.get("lastplayed")
+            if lastplayed:
+                utc_timestamp = _kodi_time_to_utc_iso(lastplayed)
+                if utc_timestamp:
+                    ep_obj["watched_at"] = utc_timestamp
+            
+            return ep_obj
+        
+        watched_episodes.sort(key=show_season)
+        
+        for (tvshowid, season_num), group in groupby(watched_episodes, key=show_season):
+            group = list(group)
             
             # Get show info
             show = tv_shows.get(tvshowid, {})
             show_ids = self._extract_ids(show) if show else None
             
             if not show_ids:
-                # Try to get IDs from episode uniqueid
-                show_ids = self._extract_ids(ep)
-            
-            if not show_ids:
-                log_debug(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() Skipping '{ep.get('showtitle')}' S{ep.get('season')}E{ep.get('episode')} - no show IDs")
-                skipped += 1
-                continue
+                # Try to get IDs from each episode's uniqueid instead
+                with_ids = []
+                for ep in group:
+                    if self._extract_ids(ep):
+                        with_ids.append(ep)
+                    else:
+                        log_debug(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() Skipping '{ep.get('showtitle')}' S{ep.get('season')}E{ep.get('episode')} - no show IDs")
+                        skipped += 1
+                if not with_ids:
+                    continue
+                group = with_ids
+                show_ids = self._extract_ids(group[0])
             
             # Create show entry if needed
             show_key = str(tvshowid)
             if show_key not in shows_data:
                 shows_data[show_key] = {
-                    "title": ep.get("showtitle") or show.get("title", "Unknown"),
+                    "title": group[0].get("showtitle") or show.get("title", "Unknown"),
                     "year": show.get("year"),
                     "ids": show_ids,
                     "seasons": []
                 }
             
-            # Find or create season
-            season_num = ep.get("season", 0)
-            season = None
-            for s in shows_data[show_key]["seasons"]:
-                if s["number"] == season_num:
-                    season = s
-                    break
-            
-            if not season:
-                season = {"number": season_num, "episodes": []}
-                shows_data[show_key]["seasons"].append(season)
-            
-            # Add episode
-            ep_obj = {
-                "number": ep.get("episode", 0)
-            }
-            
-            # Add watched_at if available
-            if ep.get("lastplayed"):
-                lastplayed = ep["lastplayed"]
-                if lastplayed and lastplayed != "":
-                    utc_timestamp = _kodi_time_to_utc_iso(lastplayed)
-                    if utc_timestamp:
-                        ep_obj["watched_at"] = utc_timestamp
-            
-            season["episodes"].append(ep_obj)
+            # Each (show, season) group appears exactly once
+            shows_data[show_key]["seasons"].append({
+                "number": season_num,
+                "episodes": [episode_obj(ep) for ep in group]
+            })
         
         if skipped > 0:
             log_warning(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() Skipped {skipped} episodes without valid show IDs")
@@ -896,7 +1139,6 @@ class SyncManager:
         self.stats['shows_exported'] = len(shows_data)
         
         # Save current sync state after successful export
-        current_state = self._build_episode_state(kodi_episodes)
         self._save_sync_state('episodes', current_state)
         
         log(f"[sync v{__version__}] SyncManager.export_episodes_to_simkl() === Episode Export Complete: {total_sent} episodes sent to SIMKL ===")
@@ -935,43 +1177,34 @@ class SyncManager:
         if self.show_progress:
             self.progress_dialog = xbmcgui.DialogProgress()
             self.progress_dialog.create("SIMKL Sync", "Preparing to sync...")
+            self._last_cancel_check = 0.0
         
         try:
             # Export movies
             if sync_movies:
-                if self.show_progress:
-                    self.progress_dialog.update(10, "Exporting movies to SIMKL...")
-                    if self.progress_dialog.iscanceled():
-                        self.cancelled = True
-                        self._notify("SIMKL Sync", "Sync cancelled")
-                        return self.stats
+                if self._update_progress(10, "Exporting movies to SIMKL..."):
+                    self._notify("SIMKL Sync", "Sync cancelled")
+                    return self.stats
                 
                 self.export_movies_to_simkl()
             
             # Export episodes
             if sync_episodes:
-                if self.show_progress:
-                    self.progress_dialog.update(50, "Exporting TV episodes to SIMKL...")
-                    if self.progress_dialog.iscanceled():
-                        self.cancelled = True
-                        self._notify("SIMKL Sync", "Sync cancelled")
-                        return self.stats
+                if self._update_progress(50, "Exporting TV episodes to SIMKL..."):
+                    self._notify("SIMKL Sync", "Sync cancelled")
+                    return self.stats
                 
                 self.export_episodes_to_simkl()
             
             # Export ratings
-            if self.show_progress:
-                self.progress_dialog.update(80, "Exporting ratings to SIMKL...")
-                if self.progress_dialog.iscanceled():
-                    self.cancelled = True
-                    self._notify("SIMKL Sync", "Sync cancelled")
-                    return self.stats
+            if self._update_progress(80, "Exporting ratings to SIMKL..."):
+                self._notify("SIMKL Sync", "Sync cancelled")
+                return self.stats
             
             self.export_ratings_to_simkl()
             
             # Done!
-            if self.show_progress:
-                self.progress_dialog.update(100, "Export complete!")
+            self._update_progress(100, "Export complete!")
             
         except Exception as e:
             log_error(f"[sync v{__version__}] SyncManager.sync_to_simkl() Sync failed with exception: {e}")
@@ -981,6 +1214,7 @@ class SyncManager:
         finally:
             if self.progress_dialog:
                 self.progress_dialog.close()
+                self.progress_dialog = None
         
         # === TOAST: Sync Complete ===
         movies = self.stats['movies_exported']
@@ -1006,39 +1240,24 @@ class SyncManager:
 
     # ========== Import: SIMKL → Kodi ==========
     
-    def _set_movie_playcount(self, movie_id, playcount=1):
+    def _set_playcounts_bulk(self, media_type, updates):
         """
-        Update a movie's playcount in Kodi.
+        Update many movie or episode playcounts in Kodi with batched JSON-RPC.
         
         Args:
-            movie_id (int): Kodi movie database ID
-            playcount (int): New playcount value
+            media_type (str): "movie" or "episode"
+            updates (list): (kodi_id, playcount) tuples
             
         Returns:
-            bool: Success
+            list: Success (bool) for each update, in order
         """
-        result = self._kodi_rpc("VideoLibrary.SetMovieDetails", {
-            "movieid": movie_id,
-            "playcount": playcount
-        })
-        return result is not None
-    
-    def _set_episode_playcount(self, episode_id, playcount=1):
-        """
-        Update an episode's playcount in Kodi.
+        if media_type == "movie":
+            method, id_key = "VideoLibrary.SetMovieDetails", "movieid"
+        else:
+            method, id_key = "VideoLibrary.SetEpisodeDetails", "episodeid"
         
-        Args:
-            episode_id (int): Kodi episode database ID
-            playcount (int): New playcount value
-            
-        Returns:
-            bool: Success
-        """
-        result = self._kodi_rpc("VideoLibrary.SetEpisodeDetails", {
-            "episodeid": episode_id,
-            "playcount": playcount
-        })
-        return result is not None
+        calls = [(method, {id_key: kodi_id, "playcount": playcount}) for kodi_id, playcount in updates]
+        return [result is not None for result in self._kodi_rpc_batch(calls)]
     
     def _match_movie_to_kodi(self, simkl_movie, kodi_movies_by_id):
         """
@@ -1048,7 +1267,7 @@ class SyncManager:
         
         Args:
             simkl_movie (dict): Movie object from SIMKL
-            kodi_movies_by_id (dict): Kodi movies indexed by various IDs
+            kodi_movies_by_id (dict): Kodi movies keyed by (id_type, id) tuples
             
         Returns:
             dict: Kodi movie or None if not found
@@ -1056,19 +1275,14 @@ class SyncManager:
         movie_data = simkl_movie.get("movie", {})
         ids = movie_data.get("ids", {})
         
-        # Try IMDb first (most reliable)
-        if ids.get("imdb"):
-            imdb = ids["imdb"]
-            if imdb in kodi_movies_by_id.get("imdb", {}):
-                return kodi_movies_by_id["imdb"][imdb]
+        # Try IMDb first (most reliable), then TMDb
+        movie = None
+        if imdb := ids.get("imdb"):
+            movie = kodi_movies_by_id.get(("imdb", imdb))
+        if movie is None and (tmdb := ids.get("tmdb")):
+            movie = kodi_movies_by_id.get(("tmdb", str(tmdb)))
         
-        # Try TMDb
-        if ids.get("tmdb"):
-            tmdb = str(ids["tmdb"])
-            if tmdb in kodi_movies_by_id.get("tmdb", {}):
-                return kodi_movies_by_id["tmdb"][tmdb]
-        
-        return None
+        return movie
     
     def _match_show_to_kodi(self, simkl_ids, kodi_shows_by_id):
         """
@@ -1105,25 +1319,28 @@ class SyncManager:
         """
         Build an index of Kodi movies by their various IDs.
         
+        One flat dict keyed by (id_type, id) tuples, so each match probe
+        is a single lookup.
+        
         Returns:
-            dict: {"imdb": {id: movie}, "tmdb": {id: movie}, ...}
+            dict: {("imdb", id): movie, ("tmdb", id): movie, ...}
         """
-        index = {"imdb": {}, "tmdb": {}, "tvdb": {}}
+        index = {}
         
         for movie in kodi_movies:
             # Index by uniqueid
-            uniqueid = movie.get("uniqueid", {})
+            uniqueid = movie.get("uniqueid") or {}
             
-            if uniqueid.get("imdb"):
-                index["imdb"][uniqueid["imdb"]] = movie
+            if imdb := uniqueid.get("imdb"):
+                index[("imdb", imdb)] = movie
             
-            if uniqueid.get("tmdb"):
-                index["tmdb"][str(uniqueid["tmdb"])] = movie
+            if tmdb := uniqueid.get("tmdb"):
+                index[("tmdb", tmdb)] = movie
             
             # Also check imdbnumber field
-            imdbnumber = movie.get("imdbnumber", "")
-            if imdbnumber.startswith("tt"):
-                index["imdb"][imdbnumber] = movie
+            imdbnumber = movie.get("imdbnumber")
+            if imdbnumber and imdbnumber.startswith("tt"):
+                index[("imdb", imdbnumber)] = movie
         
         return index
     
@@ -1134,26 +1351,30 @@ class SyncManager:
         Returns:
             dict: {"imdb": {id: show}, "tvdb": {id: show}, "tmdb": {id: show}}
         """
-        index = {"imdb": {}, "tmdb": {}, "tvdb": {}}
+        by_imdb, by_tmdb, by_tvdb = {}, {}, {}
+        index = {"imdb": by_imdb, "tmdb": by_tmdb, "tvdb": by_tvdb}
         
         for show in kodi_shows.values():
-            uniqueid = show.get("uniqueid", {})
+            show_get = show.get
+            uniqueid_get = (show_get("uniqueid") or {}).get
             
-            if uniqueid.get("imdb"):
-                index["imdb"][uniqueid["imdb"]] = show
+            if imdb := uniqueid_get("imdb"):
+                by_imdb[imdb] = show
             
-            if uniqueid.get("tvdb"):
-                index["tvdb"][str(uniqueid["tvdb"])] = show
+            if tvdb := uniqueid_get("tvdb"):
+                by_tvdb[tvdb] = show
             
-            if uniqueid.get("tmdb"):
-                index["tmdb"][str(uniqueid["tmdb"])] = show
+            if tmdb := uniqueid_get("tmdb"):
+                by_tmdb[tmdb] = show
             
-            # Check imdbnumber field
-            imdbnumber = show.get("imdbnumber", "")
+            # Check imdbnumber field (usually empty - skip the string checks then)
+            imdbnumber = show_get("imdbnumber")
+            if not imdbnumber:
+                continue
             if imdbnumber.startswith("tt"):
-                index["imdb"][imdbnumber] = show
+                by_imdb[imdbnumber] = show
             elif imdbnumber.isdigit():
-                index["tvdb"][imdbnumber] = show
+                by_tvdb[imdbnumber] = show
         
         return index
     
@@ -1162,26 +1383,16 @@ class SyncManager:
         Build an index of Kodi episodes by show ID, season, and episode.
         
         Returns:
-            dict: {tvshowid: {season: {episode: episode_obj}}}
+            dict: {(tvshowid, season, episode): episode_obj}
         """
         index = {}
         
         for ep in kodi_episodes:
-            tvshowid = ep.get("tvshowid")
-            season = ep.get("season", 0)
-            episode = ep.get("episode", 0)
-            
-            if tvshowid not in index:
-                index[tvshowid] = {}
-            
-            if season not in index[tvshowid]:
-                index[tvshowid][season] = {}
-            
-            index[tvshowid][season][episode] = ep
+            index[(ep.get("tvshowid"), ep.get("season", 0), ep.get("episode", 0))] = ep
         
         return index
     
-    def import_movies_from_simkl(self, date_from=None):
+    def import_movies_from_simkl(self, date_from=None, unmark=None):
         """
         Import watched movies from SIMKL to Kodi.
         
@@ -1197,6 +1408,8 @@ class SyncManager:
                        If None, fetches ALL completed movies (full sync).
                        Per SIMKL team feedback: use /sync/activities timestamps
                        to determine this value.
+            unmark: Whether to unmark items not on SIMKL. If None, reads
+                    the 'unmark_not_on_simkl' setting.
         
         Returns:
             int: Number of movies marked as watched
@@ -1204,6 +1417,14 @@ class SyncManager:
         sync_mode = f"incremental from {date_from}" if date_from else "FULL"
         log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() === Starting Movie Import from SIMKL ({sync_mode}) ===")
         
+        # Get Kodi movies first - with nothing to match there is no point
+        # calling the SIMKL API
+        kodi_movies = self.get_kodi_movies()
+        
+        if not kodi_movies:
+            log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() No movies in Kodi library to match")
+            return 0
+        
         # Get completed movies from SIMKL (with optional date filter)
         simkl_movies = self.api.get_all_items("movies", "completed", date_from=date_from)
         
@@ -1213,30 +1434,25 @@ class SyncManager:
         else:
             log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() Found {len(simkl_movies)} completed movies on SIMKL")
         
-        # Get Kodi movies
-        kodi_movies = self.get_kodi_movies()
-        
-        if not kodi_movies:
-            log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() No movies in Kodi library to match")
-            return 0
-        
         # Build index for fast lookup
         kodi_index = self._build_kodi_movie_index(kodi_movies)
         
-        # Build SIMKL movie ID set for unmark checking
-        simkl_movie_ids = set()
+        # Build SIMKL movie ID sets (one per ID type) for unmark checking
+        simkl_imdb_ids = set()
+        simkl_tmdb_ids = set()
         for simkl_movie in simkl_movies:
             movie_data = simkl_movie.get("movie", {})
             ids = movie_data.get("ids", {})
-            if ids.get("imdb"):
-                simkl_movie_ids.add(("imdb", ids["imdb"]))
-            if ids.get("tmdb"):
-                simkl_movie_ids.add(("tmdb", str(ids["tmdb"])))
+            if imdb := ids.get("imdb"):
+                simkl_imdb_ids.add(imdb)
+            if tmdb := ids.get("tmdb"):
+                simkl_tmdb_ids.add(str(tmdb))
         
-        # Match and update
+        # Match, then update all matches in one batch
         imported = 0
         already_watched = 0
         not_found = 0
+        to_mark = []  # (movieid, title)
         
         for simkl_movie in simkl_movies:
             # Find in Kodi
@@ -1253,11 +1469,12 @@ class SyncManager:
                 already_watched += 1
                 continue
             
-            # Mark as watched in Kodi
-            movie_id = kodi_movie.get("movieid")
-            title = kodi_movie.get("title", "Unknown")
-            
-            if self._set_movie_playcount(movie_id, 1):
+            # Queue to mark as watched in Kodi
+            to_mark.append((kodi_movie.get("movieid"), kodi_movie.get("title", "Unknown")))
+        
+        results = self._set_playcounts_bulk("movie", [(movie_id, 1) for movie_id, _ in to_mark])
+        for (movie_id, title), ok in zip(to_mark, results):
+            if ok:
                 log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() Marked as watched: {title}")
                 imported += 1
             else:
@@ -1272,11 +1489,13 @@ class SyncManager:
         # so the absence of an item does NOT mean it's not on SIMKL - it just
         # means it wasn't changed since date_from. Unmarking during incremental
         # sync would incorrectly remove valid watched status.
-        if get_setting_bool('unmark_not_on_simkl'):
+        if unmark is None:
+            unmark = get_setting_bool('unmark_not_on_simkl')
+        if unmark:
             if date_from:
                 log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() Skipping unmark check - incremental sync only has partial data")
             else:
-                unmarked = self._unmark_movies_not_on_simkl(kodi_movies, simkl_movie_ids)
+                unmarked = self._unmark_movies_not_on_simkl(kodi_movies, simkl_imdb_ids, simkl_tmdb_ids)
                 self.stats['movies_unmarked'] = unmarked
                 log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() Unmarked {unmarked} movies not found on SIMKL")
         
@@ -1285,13 +1504,14 @@ class SyncManager:
         log(f"[sync v{__version__}] SyncManager.import_movies_from_simkl() === Movie Import Complete: {imported} movies marked as watched ===")
         return imported
     
-    def _unmark_movies_not_on_simkl(self, kodi_movies, simkl_movie_ids):
+    def _unmark_movies_not_on_simkl(self, kodi_movies, simkl_imdb_ids, simkl_tmdb_ids):
         """
         Unmark movies in Kodi that are watched but not on SIMKL.
         
         Args:
             kodi_movies (list): All movies from Kodi
-            simkl_movie_ids (set): Set of (id_type, id_value) tuples from SIMKL
+            simkl_imdb_ids (set): IMDb IDs of movies on SIMKL
+            simkl_tmdb_ids (set): TMDb IDs (as str) of movies on SIMKL
             
         Returns:
             int: Number of movies unmarked
@@ -1299,40 +1519,36 @@ class SyncManager:
         log(f"[sync v{__version__}] SyncManager._unmark_movies_not_on_simkl() Checking for movies to unmark (not on SIMKL)...")
         unmarked = 0
         
-        for movie in kodi_movies:
-            # Skip if not watched
-            if movie.get("playcount", 0) == 0:
-                continue
-            
-            # Check if this movie is on SIMKL
-            uniqueid = movie.get("uniqueid", {})
-            found_on_simkl = False
-            
-            # Check IMDb
-            if uniqueid.get("imdb"):
-                if ("imdb", uniqueid["imdb"]) in simkl_movie_ids:
-                    found_on_simkl = True
-            
-            # Check TMDb
-            if not found_on_simkl and uniqueid.get("tmdb"):
-                if ("tmdb", str(uniqueid["tmdb"])) in simkl_movie_ids:
-                    found_on_simkl = True
-            
-            # If not on SIMKL, unmark it
-            if not found_on_simkl:
-                movie_id = movie.get("movieid")
-                title = movie.get("title", "Unknown")
-                
-                if self._set_movie_playcount(movie_id, 0):
-                    log(f"[sync v{__version__}] SyncManager._unmark_movies_not_on_simkl() Unmarked (not on SIMKL): {title}")
-                    unmarked += 1
-                else:
-                    log_error(f"[sync v{__version__}] SyncManager._unmark_movies_not_on_simkl() Failed to unmark: {title}")
-                    self.stats['errors'] += 1
+        def on_simkl(movie):
+            uniqueid = movie.get("uniqueid") or {}
+            imdb = uniqueid.get("imdb")
+            if imdb and imdb in simkl_imdb_ids:
+                return True
+            tmdb = uniqueid.get("tmdb")
+            return bool(tmdb) and tmdb in simkl_tmdb_ids
+        
+        # Only watched movies can need unmarking
+        watched = [movie for movie in kodi_movies if movie.get("playcount", 0) > 0]
+        
+        # Not on SIMKL under any of its IDs - queue it for unmarking
+        to_unmark = [
+            (movie.get("movieid"), movie.get("title", "Unknown"))  # (movieid, title)
+            for movie in watched
+            if not on_simkl(movie)
+        ]
+        
+        results = self._set_playcounts_bulk("movie", [(movie_id, 0) for movie_id, _ in to_unmark])
+        for (movie_id, title), ok in zip(to_unmark, results):
+            if ok:
+                log(f"[sync v{__version__}] SyncManager._unmark_movies_not_on_simkl() Unmarked (not on SIMKL): {title}")
+                unmarked += 1
+            else:
+                log_error(f"[sync v{__version__}] SyncManager._unmark_movies_not_on_simkl() Failed to unmark: {title}")
+                self.stats['errors'] += 1
         
         return unmarked
 
-    def import_episodes_from_simkl(self, date_from=None):
+    def import_episodes_from_simkl(self, date_from=None, unmark=None):
         """
         Import watched TV episodes from SIMKL to Kodi.
         
@@ -1345,6 +1561,8 @@ class SyncManager:
                        If None, fetches ALL shows (full sync).
                        Per SIMKL team feedback: use /sync/activities timestamps
                        to determine this value.
+            unmark: Whether to unmark items not on SIMKL. If None, reads
+                    the 'unmark_not_on_simkl' setting.
         
         Returns:
             int: Number of episodes marked as watched
@@ -1352,6 +1570,20 @@ class SyncManager:
         sync_mode = f"incremental from {date_from}" if date_from else "FULL"
         log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() === Starting Episode Import from SIMKL ({sync_mode}) ===")
         
+        # Get Kodi shows and episodes first - both SIMKL lists are useless
+        # without local shows to match them against
+        kodi_shows = self.get_kodi_tvshows()
+        
+        if not kodi_shows:
+            log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() No TV shows in Kodi library")
+            return 0
+        
+        kodi_episodes = self.get_kodi_episodes()
+        
+        if not kodi_episodes:
+            log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() No episodes in Kodi library")
+            return 0
+        
         # Get completed shows from SIMKL (includes episode info, with optional date filter)
         simkl_shows = self.api.get_all_items("shows", "completed", date_from=date_from)
         
@@ -1375,7 +1607,8 @@ class SyncManager:
         # (where the status transition itself is reliably timestamped).
         simkl_watching = self.api.get_all_items("shows", "watching")
         
-        all_shows = (simkl_shows or []) + (simkl_watching or [])
+        # Stream both lists straight into the merge - no concatenated copy
+        all_shows = self._merge_duplicate_shows(chain(simkl_shows or [], simkl_watching or []))
         
         if not all_shows:
             log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() No shows with watched episodes on SIMKL")
@@ -1383,28 +1616,18 @@ class SyncManager:
         
         log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Found {len(all_shows)} shows on SIMKL ({len(simkl_shows or [])} completed, {len(simkl_watching or [])} watching)")
         
-        # Get Kodi shows and episodes
-        kodi_shows = self.get_kodi_tvshows()
-        kodi_episodes = self.get_kodi_episodes()
-        
-        if not kodi_shows:
-            log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() No TV shows in Kodi library")
-            return 0
-        
-        if not kodi_episodes:
-            log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() No episodes in Kodi library")
-            return 0
-        
         # Build indexes
         show_index = self._build_kodi_show_index(kodi_shows)
         episode_index = self._build_kodi_episode_index(kodi_episodes)
         
-        # Match and update
+        # Match, then update all matches in one batch
         imported = 0
         already_watched = 0
         not_found_shows = 0
         not_found_eps = 0
         matched_shows = set()
+        to_mark = []  # (episodeid, tvshowid, show_title, season, episode)
+        simkl_episodes = set()  # (tvshowid, season, episode) watched on SIMKL, for unmarking
         
         for simkl_show in all_shows:
             show_data = simkl_show.get("show", {})
@@ -1437,12 +1660,14 @@ class SyncManager:
                 
                 for ep_data in episodes:
                     ep_num = ep_data.get("number", 0)
+                    key = (kodi_tvshowid, season_num, ep_num)
+                    if key in simkl_episodes:
+                        # Already handled via another list entry for this show
+                        continue
+                    simkl_episodes.add(key)
                     
                     # Find episode in Kodi
-                    kodi_ep = None
-                    if kodi_tvshowid in episode_index:
-                        if season_num in episode_index[kodi_tvshowid]:
-                            kodi_ep = episode_index[kodi_tvshowid][season_num].get(ep_num)
+                    kodi_ep = episode_index.get(key)
                     
                     if not kodi_ep:
                         not_found_eps += 1
@@ -1453,16 +1678,19 @@ class SyncManager:
                         already_watched += 1
                         continue
                     
-                    # Mark as watched
-                    ep_id = kodi_ep.get("episodeid")
-                    
-                    if self._set_episode_playcount(ep_id, 1):
-                        log_debug(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Marked: {show_title} S{season_num:02d}E{ep_num:02d}")
-                        imported += 1
-                        matched_shows.add(kodi_tvshowid)
-                    else:
-                        log_error(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Failed: {show_title} S{season_num:02d}E{ep_num:02d}")
-                        self.stats['errors'] += 1
+                    # Queue to mark as watched
+                    to_mark.append((kodi_ep.get("episodeid"), kodi_tvshowid, show_title, season_num, ep_num))
+        
+        # Update all matched episodes in one batch
+        results = self._set_playcounts_bulk("episode", [(entry[0], 1) for entry in to_mark])
+        for (ep_id, kodi_tvshowid, show_title, season_num, ep_num), ok in zip(to_mark, results):
+            if ok:
+                log_debug(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Marked: {show_title} S{season_num:02d}E{ep_num:02d}")
+                imported += 1
+                matched_shows.add(kodi_tvshowid)
+            else:
+                log_error(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Failed: {show_title} S{season_num:02d}E{ep_num:02d}")
+                self.stats['errors'] += 1
         
         log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Import results: {imported} marked, {already_watched} already watched")
         log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Not found: {not_found_shows} shows, {not_found_eps} episodes")
@@ -1471,12 +1699,12 @@ class SyncManager:
         # IMPORTANT: Only unmark during FULL sync (no date_from filter).
         # During incremental sync, we only fetched shows changed since date_from,
         # so the absence of an episode does NOT mean it's not on SIMKL.
-        if get_setting_bool('unmark_not_on_simkl'):
+        if unmark is None:
+            unmark = get_setting_bool('unmark_not_on_simkl')
+        if unmark:
             if date_from:
                 log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Skipping unmark check - incremental sync only has partial data")
             else:
-                # Build set of watched episodes on SIMKL for checking
-                simkl_episodes = self._build_simkl_episode_set(all_shows, show_index)
                 unmarked = self._unmark_episodes_not_on_simkl(kodi_episodes, simkl_episodes)
                 self.stats['episodes_unmarked'] = unmarked
                 log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() Unmarked {unmarked} episodes not found on SIMKL")
@@ -1487,40 +1715,45 @@ class SyncManager:
         log(f"[sync v{__version__}] SyncManager.import_episodes_from_simkl() === Episode Import Complete: {imported} episodes marked as watched ===")
         return imported
     
-    def _build_simkl_episode_set(self, simkl_shows, kodi_show_index):
+    def _merge_duplicate_shows(self, simkl_shows):
         """
-        Build a set of (tvshowid, season, episode) tuples for episodes on SIMKL.
+        Collapse SIMKL shows listed more than once into a single entry.
+        
+        A partially re-watched show can be in both the completed and the
+        watching list. Duplicates (by SIMKL, IMDb or TMDb ID) are merged
+        rather than dropped, since each entry may carry different episodes.
         
         Args:
-            simkl_shows (list): Shows from SIMKL
-            kodi_show_index (dict): Kodi show index for matching
+            simkl_shows (iterable): Show entries from SIMKL
             
         Returns:
-            set: Set of (tvshowid, season, episode) tuples
+            list: Show entries, one per show
         """
-        episode_set = set()
+        merged = []
+        by_key = {}  # show key -> index into merged
+        total = 0
         
         for simkl_show in simkl_shows:
-            show_data = simkl_show.get("show", {})
-            show_ids = show_data.get("ids", {})
-            
-            # Find show in Kodi
-            kodi_show = self._match_show_to_kodi(show_ids, kodi_show_index)
-            if not kodi_show:
-                continue
-            
-            kodi_tvshowid = kodi_show.get("tvshowid")
-            seasons = simkl_show.get("seasons", [])
-            
-            for season_data in seasons:
-                season_num = season_data.get("number", 0)
-                episodes = season_data.get("episodes", [])
-                
-                for ep_data in episodes:
-                    ep_num = ep_data.get("number", 0)
-                    episode_set.add((kodi_tvshowid, season_num, ep_num))
+            total += 1
+            ids = simkl_show.get("show", {}).get("ids", {})
+            key = ids.get("simkl") or ids.get("imdb") or ids.get("tmdb")
+            
+            if not key:
+                merged.append(simkl_show)
+            elif key not in by_key:
+                by_key[key] = len(merged)
+                merged.append(simkl_show)
+            else:
+                first = merged[by_key[key]]
+                merged[by_key[key]] = {
+                    **first,
+                    "seasons": (first.get("seasons") or []) + (simkl_show.get("seasons") or [])
+                }
+        
+        if len(merged) < total:
+            log_debug(f"[sync v{__version__}] SyncManager._merge_duplicate_shows() Merged {total - len(merged)} duplicate show entries")
         
-        return episode_set
+        return merged
     
     def _unmark_episodes_not_on_simkl(self, kodi_episodes, simkl_episodes):
         """
@@ -1535,66 +1768,52 @@ class SyncManager:
         """
         log(f"[sync v{__version__}] SyncManager._unmark_episodes_not_on_simkl() Checking for episodes to unmark (not on SIMKL)...")
         unmarked = 0
+        to_unmark = []  # (episodeid, showtitle, season, episode)
         
-        for episode in kodi_episodes:
-            # Skip if not watched
-            if episode.get("playcount", 0) == 0:
-                continue
-            
+        # Only watched episodes can need unmarking
+        watched = [episode for episode in kodi_episodes if episode.get("playcount", 0) > 0]
+        
+        for episode in watched:
             # Check if this episode is on SIMKL
             tvshowid = episode.get("tvshowid")
             season = episode.get("season", 0)
             episode_num = episode.get("episode", 0)
             
             if (tvshowid, season, episode_num) not in simkl_episodes:
-                # Not on SIMKL, unmark it
-                episode_id = episode.get("episodeid")
-                title = episode.get("showtitle", "Unknown")
-                
-                if self._set_episode_playcount(episode_id, 0):
-                    log(f"[sync v{__version__}] SyncManager._unmark_episodes_not_on_simkl() Unmarked (not on SIMKL): {title} S{season:02d}E{episode_num:02d}")
-                    unmarked += 1
-                else:
-                    log_error(f"[sync v{__version__}] SyncManager._unmark_episodes_not_on_simkl() Failed to unmark: {title} S{season:02d}E{episode_num:02d}")
-                    self.stats['errors'] += 1
+                # Not on SIMKL, queue it for unmarking
+                to_unmark.append((episode.get("episodeid"), episode.get("showtitle", "Unknown"), season, episode_num))
+        
+        results = self._set_playcounts_bulk("episode", [(entry[0], 0) for entry in to_unmark])
+        for (episode_id, title, season, episode_num), ok in zip(to_unmark, results):
+            if ok:
+                log(f"[sync v{__version__}] SyncManager._unmark_episodes_not_on_simkl() Unmarked (not on SIMKL): {title} S{season:02d}E{episode_num:02d}")
+                unmarked += 1
+            else:
+                log_error(f"[sync v{__version__}] SyncManager._unmark_episodes_not_on_simkl() Failed to unmark: {title} S{season:02d}E{episode_num:02d}")
+                self.stats['errors'] += 1
         
         return unmarked
     
     # ========== Rating Sync ==========
     
-    def _set_movie_rating(self, movie_id, rating):
+    def _set_ratings_bulk(self, media_type, updates):
         """
-        Update a movie's user rating in Kodi.
+        Update many movie or TV show user ratings in Kodi with batched JSON-RPC.
         
         Args:
-            movie_id (int): Kodi movie database ID
-            rating (int): Rating value 0-10 (0 = unrated)
+            media_type (str): "movie" or "tvshow"
+            updates (list): (kodi_id, rating) tuples, rating 0-10 (0 = unrated)
             
         Returns:
-            bool: Success
-        """
-        result = self._kodi_rpc("VideoLibrary.SetMovieDetails", {
-            "movieid": movie_id,
-            "userrating": rating
-        })
-        return result is not None
-    
-    def _set_show_rating(self, tvshowid, rating):
+            list: Success (bool) for each update, in order
         """
-        Update a TV show's user rating in Kodi.
+        if media_type == "movie":
+            method, id_key = "VideoLibrary.SetMovieDetails", "movieid"
+        else:
+            method, id_key = "VideoLibrary.SetTVShowDetails", "tvshowid"
         
-        Args:
-            tvshowid (int): Kodi TV show database ID
-            rating (int): Rating value 0-10 (0 = unrated)
-            
-        Returns:
-            bool: Success
-        """
-        result = self._kodi_rpc("VideoLibrary.SetTVShowDetails", {
-            "tvshowid": tvshowid,
-            "userrating": rating
-        })
-        return result is not None
+        calls = [(method, {id_key: kodi_id, "userrating": rating}) for kodi_id, rating in updates]
+        return [result is not None for result in self._kodi_rpc_batch(calls)]
     
     def export_ratings_to_simkl(self):
         """
@@ -1646,9 +1865,9 @@ class SyncManager:
             tmdb = ids.get("tmdb")
             simkl_rating = None
             if imdb:
-                simkl_rating = simkl_movie_ratings.get(("imdb", str(imdb)))
+                simkl_rating = simkl_movie_ratings.get(("imdb", imdb))
             if simkl_rating is None and tmdb:
-                simkl_rating = simkl_movie_ratings.get(("tmdb", str(tmdb)))
+                simkl_rating = simkl_movie_ratings.get(("tmdb", tmdb))
             
             if simkl_rating == rating:
                 continue  # Already matches, skip
@@ -1712,11 +1931,11 @@ class SyncManager:
             tvdb = ids.get("tvdb")
             simkl_rating = None
             if imdb:
-                simkl_rating = simkl_show_ratings.get(("imdb", str(imdb)))
+                simkl_rating = simkl_show_ratings.get(("imdb", imdb))
             if simkl_rating is None and tmdb:
-                simkl_rating = simkl_show_ratings.get(("tmdb", str(tmdb)))
+                simkl_rating = simkl_show_ratings.get(("tmdb", tmdb))
             if simkl_rating is None and tvdb:
-                simkl_rating = simkl_show_ratings.get(("tvdb", str(tvdb)))
+                simkl_rating = simkl_show_ratings.get(("tvdb", tvdb))
             
             if simkl_rating == rating:
                 continue  # Already matches, skip
@@ -1768,6 +1987,9 @@ class SyncManager:
         # Track which Kodi movies have SIMKL ratings (for clearing unrated)
         simkl_rated_movie_ids = set()
         
+        # (movieid, rating, title) - written to Kodi in one batch below
+        movie_updates = []
+        
         if simkl_movie_ratings:
             log(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Found {len(simkl_movie_ratings)} movie ratings on SIMKL")
             
@@ -1794,13 +2016,7 @@ class SyncManager:
                 simkl_rating = int(rating)
                 
                 if kodi_rating != simkl_rating:
-                    movie_id = kodi_movie.get("movieid")
-                    if self._set_movie_rating(movie_id, simkl_rating):
-                        title = kodi_movie.get("title", "Unknown")
-                        log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Movie rating: {title} -> {simkl_rating}/10")
-                        imported += 1
-                    else:
-                        self.stats['errors'] += 1
+                    movie_updates.append((kodi_movie.get("movieid"), simkl_rating, kodi_movie.get("title", "Unknown")))
         
         # Clear ratings for Kodi movies not rated on SIMKL
         for movie in kodi_movies:
@@ -1814,15 +2030,22 @@ class SyncManager:
                 if ("imdb", uniqueid["imdb"]) in simkl_rated_movie_ids:
                     found_on_simkl = True
             if not found_on_simkl and uniqueid.get("tmdb"):
-                if ("tmdb", str(uniqueid["tmdb"])) in simkl_rated_movie_ids:
+                if ("tmdb", uniqueid["tmdb"]) in simkl_rated_movie_ids:
                     found_on_simkl = True
             
             if not found_on_simkl:
-                movie_id = movie.get("movieid")
-                if self._set_movie_rating(movie_id, 0):
-                    title = movie.get("title", "Unknown")
+                movie_updates.append((movie.get("movieid"), 0, movie.get("title", "Unknown")))
+        
+        results = self._set_ratings_bulk("movie", [(movie_id, rating) for movie_id, rating, _ in movie_updates])
+        for (movie_id, rating, title), ok in zip(movie_updates, results):
+            if ok:
+                if rating:
+                    log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Movie rating: {title} -> {rating}/10")
+                else:
                     log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Cleared movie rating: {title}")
-                    imported += 1
+                imported += 1
+            elif rating:
+                self.stats['errors'] += 1
         
         # --- Show Ratings ---
         simkl_show_ratings = self.api.get_user_ratings("shows")
@@ -1831,6 +2054,9 @@ class SyncManager:
         
         simkl_rated_show_ids = set()
         
+        # (tvshowid, rating, title) - written to Kodi in one batch below
+        show_updates = []
+        
         if simkl_show_ratings:
             log(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Found {len(simkl_show_ratings)} show ratings on SIMKL")
             
@@ -1859,13 +2085,7 @@ class SyncManager:
                 simkl_rating = int(rating)
                 
                 if kodi_rating != simkl_rating:
-                    tvshowid = kodi_show.get("tvshowid")
-                    if self._set_show_rating(tvshowid, simkl_rating):
-                        title = kodi_show.get("title", "Unknown")
-                        log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Show rating: {title} -> {simkl_rating}/10")
-                        imported += 1
-                    else:
-                        self.stats['errors'] += 1
+                    show_updates.append((kodi_show.get("tvshowid"), simkl_rating, kodi_show.get("title", "Unknown")))
         
         # Clear ratings for Kodi shows not rated on SIMKL
         for tvshowid, show in kodi_shows.items():
@@ -1879,17 +2099,25 @@ class SyncManager:
                 if ("imdb", uniqueid["imdb"]) in simkl_rated_show_ids:
                     found_on_simkl = True
             if not found_on_simkl and uniqueid.get("tvdb"):
-                if ("tvdb", str(uniqueid["tvdb"])) in simkl_rated_show_ids:
+                if ("tvdb", uniqueid["tvdb"]) in simkl_rated_show_ids:
                     found_on_simkl = True
             if not found_on_simkl and uniqueid.get("tmdb"):
-                if ("tmdb", str(uniqueid["tmdb"])) in simkl_rated_show_ids:
+                if ("tmdb", uniqueid["tmdb"]) in simkl_rated_show_ids:
                     found_on_simkl = True
             
             if not found_on_simkl:
-                if self._set_show_rating(tvshowid, 0):
-                    title = show.get("title", "Unknown")
+                show_updates.append((tvshowid, 0, show.get("title", "Unknown")))
+        
+        results = self._set_ratings_bulk("tvshow", [(tvshowid, rating) for tvshowid, rating, _ in show_updates])
+        for (tvshowid, rating, title), ok in zip(show_updates, results):
+            if ok:
+                if rating:
+                    log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Show rating: {title} -> {rating}/10")
+                else:
                     log_debug(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() Cleared show rating: {title}")
-                    imported += 1
+                imported += 1
+            elif rating:
+                self.stats['errors'] += 1
         
         self.stats['ratings_imported'] = imported
         log(f"[sync v{__version__}] SyncManager.import_ratings_from_simkl() === Rating Import Complete: {imported} ratings updated ===")
@@ -1930,10 +2158,14 @@ class SyncManager:
         # === TOAST: Import Started ===
         self._notify("SIMKL Sync", "Importing from SIMKL...")
         
+        # Read once for both the movie and episode imports
+        unmark = get_setting_bool('unmark_not_on_simkl')
+        
         # Initialize progress dialog if requested
         if self.show_progress:
             self.progress_dialog = xbmcgui.DialogProgress()
             self.progress_dialog.create("SIMKL Sync", "Importing from SIMKL...")
+            self._last_cancel_check = 0.0
         
         try:
             # ---- Incremental sync: check /sync/activities first ----
@@ -1958,8 +2190,7 @@ class SyncManager:
                     not activity_data['ratings_changed']):
                     log(f"[sync v{__version__}] SyncManager.sync_from_simkl() No changes detected on SIMKL since last sync - skipping import")
                     
-                    if self.show_progress:
-                        self.progress_dialog.update(100, "Already in sync - no changes on SIMKL")
+                    self._update_progress(100, "Already in sync - no changes on SIMKL")
                     
                     self._notify("SIMKL Sync", "Already in sync")
                     
@@ -1978,42 +2209,33 @@ class SyncManager:
             
             # Import movies
             if sync_movies:
-                if self.show_progress:
-                    self.progress_dialog.update(10, "Importing movies from SIMKL...")
-                    if self.progress_dialog.iscanceled():
-                        self.cancelled = True
-                        self._notify("SIMKL Sync", "Import cancelled")
-                        return self.stats
+                if self._update_progress(10, "Importing movies from SIMKL..."):
+                    self._notify("SIMKL Sync", "Import cancelled")
+                    return self.stats
                 
                 # Skip movie import if activity check showed no movie changes
                 # (only applies to background sync, not force_full_sync)
                 if not self.force_full_sync and activity_data and not activity_data['movies_changed']:
                     log(f"[sync v{__version__}] SyncManager.sync_from_simkl() No movie changes on SIMKL - skipping movie import")
                 else:
-                    self.import_movies_from_simkl(date_from=movies_date_from)
+                    self.import_movies_from_simkl(date_from=movies_date_from, unmark=unmark)
             
             # Import episodes
             if sync_episodes:
-                if self.show_progress:
-                    self.progress_dialog.update(50, "Importing TV episodes from SIMKL...")
-                    if self.progress_dialog.iscanceled():
-                        self.cancelled = True
-                        self._notify("SIMKL Sync", "Import cancelled")
-                        return self.stats
+                if self._update_progress(50, "Importing TV episodes from SIMKL..."):
+                    self._notify("SIMKL Sync", "Import cancelled")
+                    return self.stats
                 
                 # Skip episode import if activity check showed no show changes
                 if not self.force_full_sync and activity_data and not activity_data['shows_changed']:
                     log(f"[sync v{__version__}] SyncManager.sync_from_simkl() No show changes on SIMKL - skipping episode import")
                 else:
-                    self.import_episodes_from_simkl(date_from=shows_date_from)
+                    self.import_episodes_from_simkl(date_from=shows_date_from, unmark=unmark)
             
             # Import ratings
-            if self.show_progress:
-                self.progress_dialog.update(80, "Importing ratings from SIMKL...")
-                if self.progress_dialog.iscanceled():
-                    self.cancelled = True
-                    self._notify("SIMKL Sync", "Import cancelled")
-                    return self.stats
+            if self._update_progress(80, "Importing ratings from SIMKL..."):
+                self._notify("SIMKL Sync", "Import cancelled")
+                return self.stats
             
             # Skip rating import if activity check showed no rating changes
             if not self.force_full_sync and activity_data and not activity_data['ratings_changed']:
@@ -2022,8 +2244,7 @@ class SyncManager:
                 self.import_ratings_from_simkl()
             
             # Done!
-            if self.show_progress:
-                self.progress_dialog.update(100, "Import complete!")
+            self._update_progress(100, "Import complete!")
             
             # Save activity timestamps after successful sync
             # This ensures the next sync can use these timestamps for delta detection
@@ -2056,6 +2277,7 @@ class SyncManager:
         finally:
             if self.progress_dialog:
                 self.progress_dialog.close()
+                self.progress_dialog = None
         
         # === TOAST: Import Complete ===
         movies = self.stats['movies_imported']
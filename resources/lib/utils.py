@@ -17,6 +17,7 @@ import xbmc
 import xbmcaddon
 import xbmcgui
 import xbmcvfs
+import time
 
 # Module version
 __version__ = '7.5.5'
@@ -27,6 +28,18 @@ xbmc.log(f'[SIMKL Scrobbler] utils.py v{__version__} - Utility module loading',
 # Addon instance - lazy loaded
 _ADDON = None
 
+# getAddonInfo() values (fixed for the life of the process) - filled by _addon_info()
+_ADDON_INFO = {}
+
+# Kodi debug logging state - lazy loaded by _kodi_debug_enabled() and
+# re-read once it is older than KODI_DEBUG_TTL seconds
+_KODI_DEBUG = None
+_KODI_DEBUG_READ_AT = 0.0
+KODI_DEBUG_TTL = 10.0
+
+# Addon debug_logging setting - lazy loaded by _debug_logging_enabled()
+_DEBUG_LOGGING = None
+
 
 def get_addon():
     """
@@ -41,16 +54,59 @@ def get_addon():
     return _ADDON
 
 
-def log(message, level=xbmc.LOGINFO):
+def _addon_info(key):
     """
-    Log a message to the Kodi log with proper formatting.
+    Get an addon info value, asking Kodi only the first time per key.
     
     Args:
-        message (str): Message to log
+        key (str): getAddonInfo() key, e.g. 'name', 'id', 'icon'
+        
+    Returns:
+        str: Addon info value
+    """
+    value = _ADDON_INFO.get(key)
+    if value is None:
+        value = _ADDON_INFO[key] = get_addon().getAddonInfo(key)
+    return value
+
+
+def _kodi_debug_enabled():
+    """
+    Check whether Kodi's own debug logging is on (cached for KODI_DEBUG_TTL).
+
+    Kodi drops LOGDEBUG messages unless debug logging is enabled, so
+    log() can skip formatting them entirely when it is off. Toggling it
+    in Kodi doesn't notify the addon, hence the short expiry.
+
+    Returns:
+        bool: True if Kodi debug logging is enabled
+    """
+    global _KODI_DEBUG, _KODI_DEBUG_READ_AT
+    now = time.monotonic()
+    if _KODI_DEBUG is None or now - _KODI_DEBUG_READ_AT >= KODI_DEBUG_TTL:
+        _KODI_DEBUG = bool(xbmc.getCondVisibility('System.GetBool(debug.showloginfo)'))
+        _KODI_DEBUG_READ_AT = now
+    return _KODI_DEBUG
+
+
+def log(message, *args, level=xbmc.LOGINFO):
+    """
+    Log a message to the Kodi log with proper formatting.
+
+    Extra positional args are applied %-style, and only when the message
+    will actually be written - LOGDEBUG messages are not formatted at all
+    while Kodi debug logging is off.
+
+    Args:
+        message (str): Message to log (optionally a %-style format string)
+        *args: Values for the %-style placeholders in message
         level (int): Log level (LOGDEBUG, LOGINFO, LOGWARNING, LOGERROR)
     """
-    addon_name = get_addon().getAddonInfo('name')
-    xbmc.log(f'[{addon_name}] {message}', level=level)
+    if level == xbmc.LOGDEBUG and not _kodi_debug_enabled():
+        return
+    if args:
+        message = message % args
+    xbmc.log(f'[{_addon_info("name")}] {message}', level=level)
 
 
 def log_error(message):
@@ -63,17 +119,44 @@ def log_error(message):
     log(message, level=xbmc.LOGERROR)
 
 
-def log_debug(message):
+def _debug_logging_enabled():
+    """
+    Check the addon's debug_logging setting (read once, then cached).
+    
+    Returns:
+        bool: True if debug logging is enabled in addon settings
+    """
+    global _DEBUG_LOGGING
+    if _DEBUG_LOGGING is None:
+        _DEBUG_LOGGING = get_setting_bool("debug_logging")
+    return _DEBUG_LOGGING
+
+
+def refresh_debug_logging():
+    """
+    Forget the cached debug logging state so it is re-read on next use.
+    
+    Call this when addon settings change.
+    """
+    global _DEBUG_LOGGING, _KODI_DEBUG
+    _DEBUG_LOGGING = None
+    _KODI_DEBUG = None
+
+
+def log_debug(message, *args):
     """
     Log a debug message.
     
-    Only actually logs if debug_logging is enabled in settings.
+    Only actually logs if debug_logging is enabled in settings. Pass
+    values as %-style args rather than an f-string so nothing is
+    formatted while debug logging is off.
     
     Args:
-        message (str): Debug message to log
+        message (str): Debug message to log (optionally a %-style format string)
+        *args: Values for the %-style placeholders in message
     """
-    if get_setting_bool("debug_logging"):
-        log(message, level=xbmc.LOGDEBUG)
+    if _debug_logging_enabled():
+        log(message, *args, level=xbmc.LOGDEBUG)
 
 
 def log_warning(message):
@@ -204,7 +287,7 @@ def notify(title, message, time_ms=None, icon_path=None):
     
     # Use addon icon if not specified
     if icon_path is None:
-        icon_path = get_addon().getAddonInfo('icon')
+        icon_path = _addon_info('icon')
     
     # Show the notification
     xbmcgui.Dialog().notification(
@@ -235,7 +318,7 @@ def get_addon_id():
     Returns:
         str: Addon ID (e.g., "script.simkl.scrobbler")
     """
-    return get_addon().getAddonInfo('id')
+    return _addon_info('id')
 
 
 def get_addon_version():
@@ -245,7 +328,7 @@ def get_addon_version():
     Returns:
         str: Addon version (e.g., "7.2.0")
     """
-    return get_addon().getAddonInfo('version')
+    return _addon_info('version')
 
 
 def get_addon_path():
@@ -255,7 +338,7 @@ def get_addon_path():
     Returns:
         str: Full path to addon directory
     """
-    return get_addon().getAddonInfo('path')
+    return _addon_info('path')
 
 
 def get_addon_profile():
@@ -265,7 +348,7 @@ def get_addon_profile():
     Returns:
         str: Full path to addon profile directory
     """
-    return xbmcvfs.translatePath(get_addon().getAddonInfo('profile'))
+    return xbmcvfs.translatePath(_addon_info('profile'))
 
 
 def format_time(seconds):